@@ -4,10 +4,23 @@ Main program
 import argparse
 import os
 
+from src import __version__
 from src.app import generate_uml_class_diagram
+from src.cache import CACHE_DIR
 from src.file_utils import expand_directory
 
 
+def positive_int(value: str) -> int:
+    """
+    Parse a CLI argument which must be a positive integer
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be a positive integer: {value}')
+
+    return number
+
+
 def setup_cli():
     """
     Setup CLI
@@ -22,7 +35,11 @@ def setup_cli():
                         help='Store PlantUML file (default)')
     parser.add_argument('-i', '--image', action='store_true', default=True,
                         help='Store image file (default)')
-    parser.add_argument('--version', action='version', version='Py2UML 1.0')
+    parser.add_argument('--no-cache', action='store_true', default=False,
+                        help=f'Do not read or write the model cache in {CACHE_DIR}')
+    parser.add_argument('-j', '--jobs', metavar='N', type=positive_int, default=None,
+                        help='Number of worker processes (default: one per CPU)')
+    parser.add_argument('--version', action='version', version=f'Py2UML {__version__}')
 
     return parser.parse_args()
 
@@ -43,4 +60,7 @@ if __name__ == "__main__":
 
     output_dir = args.output_dir
 
-    generate_uml_class_diagram(input_files, output_dir, args.plantuml, args.image)
+    cache_dir = None if args.no_cache else CACHE_DIR
+
+    generate_uml_class_diagram(input_files, output_dir, args.plantuml, args.image, cache_dir,
+                               args.jobs)
@@ -0,0 +1,4 @@
+"""
+Py2UML - generate UML class diagrams from Python source code.
+"""
+__version__ = '1.0'
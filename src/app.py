@@ -3,22 +3,58 @@ Main application logic
 """
 import os
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Optional
+
+import src.cache as cache
 import src.converters.python_to_model as p2m
 import src.converters.model_to_plantuml as m2p
 
+from src.models import ClassModel
+
+# Below this many files, starting the worker processes costs more than parsing the files
+PARALLEL_FILES_THRESHOLD = 32
+# Number of chunks handed to each worker, so a worker with slow files does not hold up the rest
+CHUNKS_PER_WORKER = 4
+
 
 def generate_uml_class_diagram(source_files: list[str], output_dir: str,
-                               is_saving_plantuml: bool = True, is_saving_image: bool = True):
+                               is_saving_plantuml: bool = True, is_saving_image: bool = True,
+                               cache_dir: Optional[str] = cache.CACHE_DIR,
+                               jobs: Optional[int] = None):
     """
     Generate UML class diagram from source folder
+    :param jobs: Number of worker processes, or None to use one per CPU.
+    :raises ValueError: If the number of jobs is not positive.
     """
+    if jobs is not None and jobs < 1:
+        raise ValueError(f'The number of jobs must be positive: {jobs}')
+
+    manifest = cache.load_manifest(cache_dir) if cache_dir is not None else {}
+    manifest_entries = [manifest.get(os.path.abspath(source_file)) for source_file in source_files]
+
+    workers = jobs if jobs is not None else os.cpu_count() or 1
+
+    if workers == 1 or len(source_files) < PARALLEL_FILES_THRESHOLD:
+        results = list(map(generate_source_file_models, source_files, repeat(cache_dir),
+                           manifest_entries))
+    else:
+        chunk_size = max(1, len(source_files) // (workers * CHUNKS_PER_WORKER))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(generate_source_file_models, source_files,
+                                        repeat(cache_dir), manifest_entries,
+                                        chunksize=chunk_size))
 
     models = []
-    for source_file in source_files:
-        print(f"Generating model from {source_file}")
-        with open(source_file, 'r', encoding='utf-8') as file:
-            file_contents = file.readlines()
-            models.append(p2m.generate_models(file_contents))
+    for source_file, (file_models, manifest_entry) in zip(source_files, results):
+        models.extend(file_models)
+        if manifest_entry is not None:
+            manifest[os.path.abspath(source_file)] = manifest_entry
+
+    if cache_dir is not None:
+        cache.store_manifest(cache_dir, cache.prune_cache(cache_dir, manifest))
 
     if is_saving_plantuml:
         output_path = os.path.join(output_dir, 'diagram.puml')
@@ -29,6 +65,60 @@ def generate_uml_class_diagram(source_files: list[str], output_dir: str,
     os.makedirs(output_dir, exist_ok=True)
     with open(output_path, 'w+', encoding='utf-8') as file:
         # TODO - Links
-        content = m2p.generate_platuml_class_diagram(sum(models, []), None)
+        content = m2p.generate_platuml_class_diagram(models, None)
         content = [line + '\n' for line in content]
         file.writelines(content)
+
+
+def generate_source_file_models(source_file: str, cache_dir: Optional[str],
+                                manifest_entry: Optional[cache.ManifestEntry] = None
+                                ) -> tuple[list[ClassModel], Optional[cache.ManifestEntry]]:
+    """
+    Generate the models of a single source file.
+    If the file has the same modification time and size as on the last run, its cached models
+        are loaded without reading the file at all.
+    Runs in a worker process when the files are processed in parallel.
+    :param source_file: Path to the source file.
+    :param cache_dir: Path to the cache directory, or None to disable the cache.
+    :param manifest_entry: The manifest entry of the file from the last run, if any.
+    :return: The models of the file, and its manifest entry for this run.
+    """
+    print(f"Generating model from {source_file}")
+
+    if cache_dir is None:
+        with open(source_file, 'r', encoding='utf-8') as file:
+            return generate_file_models(file.read(), None), None
+
+    stamp = cache.get_file_stamp(source_file)
+    if manifest_entry is not None and manifest_entry[:2] == stamp:
+        if (models := cache.load_models(cache_dir, manifest_entry[2])) is not None:
+            return models, manifest_entry
+
+    with open(source_file, 'r', encoding='utf-8') as file:
+        source = file.read()
+
+    key = cache.get_cache_key(source)
+    return generate_file_models(source, cache_dir, key), (*stamp, key)
+
+
+def generate_file_models(source: str, cache_dir: Optional[str],
+                         key: Optional[str] = None) -> list[ClassModel]:
+    """
+    Generate the models of a single source file, reusing the cached models if the file
+        has not changed since they were generated.
+    :param source: The source code of the file.
+    :param cache_dir: Path to the cache directory, or None to disable the cache.
+    :param key: The cache key of the source, if it is already known.
+    :return: The models of the file.
+    """
+    if cache_dir is None:
+        return p2m.generate_models_from_text(source)
+
+    key = key if key is not None else cache.get_cache_key(source)
+    if (models := cache.load_models(cache_dir, key)) is not None:
+        return models
+
+    models = p2m.generate_models_from_text(source)
+    cache.store_models(cache_dir, key, models)
+
+    return models
@@ -0,0 +1,163 @@
+"""
+Module containing the on-disk cache of the models generated from source files.
+"""
+import hashlib
+import json
+import os
+import pickle
+
+from typing import Optional
+
+from src import __version__
+from src.models import ClassModel
+
+CACHE_DIR_NAME = 'py2uml'
+CACHE_FILE_EXTENSION = '.pkl'
+MANIFEST_FILE_NAME = 'manifest.json'
+MANIFEST_VERSION_KEY = 'version'
+MANIFEST_FILES_KEY = 'files'
+
+# Modification time (ns), size and cache key of a source file, as recorded on the last run
+ManifestEntry = tuple[int, int, str]
+
+
+def get_default_cache_dir() -> str:
+    """
+    Get the per-user cache directory, so no run ever loads models from a directory it does
+        not own, such as one shipped inside the checkout being diagrammed.
+    :return: Path to `py2uml` in `%LOCALAPPDATA%` on Windows, otherwise in `$XDG_CACHE_HOME`
+        or `~/.cache`.
+    """
+    if os.name == 'nt' and (local_app_data := os.environ.get('LOCALAPPDATA')):
+        return os.path.join(local_app_data, CACHE_DIR_NAME)
+
+    base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, CACHE_DIR_NAME)
+
+
+CACHE_DIR = get_default_cache_dir()
+
+
+def get_cache_key(source: str) -> str:
+    """
+    Get the cache key of a source file.
+    The key includes the version, so models cached by another version are never loaded.
+    :param source: The source code of the file.
+    :return: The cache key.
+    """
+    return hashlib.sha256(f'{__version__}\0{source}'.encode('utf-8')).hexdigest()
+
+
+def get_cache_path(cache_dir: str, key: str) -> str:
+    """
+    Get the path of a cache entry.
+    :param cache_dir: Path to the cache directory.
+    :param key: The cache key.
+    :return: Path to the cache entry.
+    """
+    return os.path.join(cache_dir, key + CACHE_FILE_EXTENSION)
+
+
+def load_models(cache_dir: str, key: str) -> Optional[list[ClassModel]]:
+    """
+    Load the models of a source file from the cache.
+    :param cache_dir: Path to the cache directory.
+    :param key: The cache key of the source file.
+    :return: The models, or None if they are not cached or the entry cannot be read.
+    """
+    try:
+        with open(get_cache_path(cache_dir, key), 'rb') as file:
+            return pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+
+def store_models(cache_dir: str, key: str, models: list[ClassModel]):
+    """
+    Store the models of a source file in the cache.
+    :param cache_dir: Path to the cache directory.
+    :param key: The cache key of the source file.
+    :param models: The models to store.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    cache_path = get_cache_path(cache_dir, key)
+    temporary_path = f'{cache_path}.{os.getpid()}.tmp'
+
+    # Write to a temporary file first, so an interrupted run never leaves a truncated entry
+    with open(temporary_path, 'wb') as file:
+        pickle.dump(models, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, cache_path)
+
+
+def get_file_stamp(source_file: str) -> tuple[int, int]:
+    """
+    Get the modification time and the size of a source file.
+    :param source_file: Path to the source file.
+    :return: The modification time in nanoseconds and the size in bytes.
+    """
+    stat_result = os.stat(source_file)
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def load_manifest(cache_dir: str) -> dict[str, ManifestEntry]:
+    """
+    Load the manifest which maps each source file to the cache key of its last seen contents.
+    A manifest stored by another version is discarded, as its keys point to models generated
+        by that version.
+    :param cache_dir: Path to the cache directory.
+    :return: The manifest, or an empty one if it does not exist, cannot be read or was stored
+        by another version.
+    """
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_FILE_NAME), 'r', encoding='utf-8') as file:
+            raw_manifest = json.load(file)
+        if raw_manifest[MANIFEST_VERSION_KEY] != __version__:
+            return {}
+        return {path: (mtime_ns, size, key)
+                for path, (mtime_ns, size, key) in raw_manifest[MANIFEST_FILES_KEY].items()}
+    except (OSError, ValueError, TypeError, AttributeError, KeyError):
+        return {}
+
+
+def store_manifest(cache_dir: str, manifest: dict[str, ManifestEntry]):
+    """
+    Store the manifest which maps each source file to the cache key of its last seen contents.
+    :param cache_dir: Path to the cache directory.
+    :param manifest: The manifest to store.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    manifest_path = os.path.join(cache_dir, MANIFEST_FILE_NAME)
+    temporary_path = f'{manifest_path}.{os.getpid()}.tmp'
+
+    with open(temporary_path, 'w', encoding='utf-8') as file:
+        json.dump({MANIFEST_VERSION_KEY: __version__, MANIFEST_FILES_KEY: manifest}, file)
+    os.replace(temporary_path, manifest_path)
+
+
+def prune_cache(cache_dir: str, manifest: dict[str, ManifestEntry]) -> dict[str, ManifestEntry]:
+    """
+    Drop the manifest entries of source files which no longer exist, and delete the cached
+        models which no manifest entry refers to.
+    :param cache_dir: Path to the cache directory.
+    :param manifest: The manifest.
+    :return: The manifest without the entries of missing source files.
+    """
+    manifest = {path: entry for path, entry in manifest.items() if os.path.isfile(path)}
+    used_file_names = {key + CACHE_FILE_EXTENSION for _, _, key in manifest.values()}
+
+    try:
+        file_names = os.listdir(cache_dir)
+    except OSError:
+        return manifest
+
+    for file_name in file_names:
+        if file_name.endswith(CACHE_FILE_EXTENSION) and file_name not in used_file_names:
+            try:
+                os.remove(os.path.join(cache_dir, file_name))
+            except OSError:
+                # Another run may have removed it already
+                pass
+
+    return manifest
@@ -1,34 +1,81 @@
 """
 Module containing the converters which will be used to create the models from the Python code.
+
+The work here is string processing, which JIT compilers for numeric code such as Numba
+    do not support well, so the hot paths rely on the C parser (`ast`), the tokenizer
+    and precompiled regular expressions instead.
 """
+import ast
+import io
 import re
+import sys
+import tokenize
 
 from enum import Enum
-from re import Pattern
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+from src.models import (PRIVATE, PROTECTED, PUBLIC, ClassModel, ClassType, Method, Variable,
+                        Visibility)
 
-from src.models import ClassModel, ClassType, Method, Variable, Visibility
+# The patterns avoid consecutive unbounded quantifiers (e.g. `.*\(.*\).*:`), so a long line
+#   which does not match fails quickly instead of backtracking over every split point.
 
 # Class-related patterns
-class_pattern = re.compile(r'class (.*):')
-class_name_pattern = re.compile(r'class ([a-zA-Z0-9]*).*:')
-class_parents_pattern = re.compile(r'class .*\((.*)\)')
+class_pattern = re.compile(r'class\s+\w+\s*[(:]')
+class_header_pattern = re.compile(r'^class[ \t]', re.MULTILINE)
+top_level_line_pattern = re.compile(r'^(?=\S)', re.MULTILINE)
+class_parents_pattern = re.compile(r'class \w+\s*\((?P<parents>.*)\)')
 
 # Attribute-related patterns
-attribute_pattern = re.compile(r'self\.(.*) =')
-attribute_name_pattern = re.compile(r'self\.(_){0,2}(.*) =')
-attribute_type_pattern = re.compile(r'self\..* *: *(.*) =')
+attribute_declaration_pattern = re.compile(
+    r'self\.(?P<underscores>_{0,2})(?P<name>\w+)\s*(?::(?P<type>[^=]*)=)?')
 
 # Method-related patterns
-method_pattern = re.compile(r'def .*\(self.*\).*:')
-method_name_pattern = re.compile(r'def (.*)\(self.*')
-method_return_type_pattern = re.compile(r'def .*\(.*\) ->(.*):')
+method_pattern = re.compile(r'def \w+\(\s*(?:self|cls)\b')
+method_name_pattern = re.compile(r'def (?P<name>\w+)\(')
+method_return_type_pattern = re.compile(r'def \w+\(.*\)\s*->(?P<return_type>[^:]*):')
+method_line_pattern = re.compile(r'def \w+\(.*:')
 STATIC_METHOD_NAME = '@staticmethod'
 ABSTRACT_METHOD_NAME = '@abstractmethod'
 
+# Argument-related patterns
+argument_name_pattern = re.compile(r'\s*(?P<name>\**[a-zA-Z_][a-zA-Z0-9_]*)')
+argument_type_pattern = re.compile(r'[^:=]*:(?P<type>[^=]*)')
+argument_item_pattern = re.compile(
+    r'(?P<name>\**[a-zA-Z_][a-zA-Z0-9_]*)\s*(?::(?P<type>[^,=]*))?(?:=[^,]*)?')
+
 # Other constants
+# Recent single-line results, as boilerplate such as `def __init__(self):` repeats across files
+PARSE_CACHE_SIZE = 4096
+# Recent whole-class results, as the getters of one class are called one after another
+CLASS_CACHE_SIZE = 32
 PARENT_ABSTRACT_NAME = 'ABC'
+PARENT_ABSTRACT_META_NAME = 'ABCMeta'
 PARENT_ENUM_NAME = 'Enum'
 PARENT_EXCEPTION_NAME = 'Exception'
+# The other bases of the standard library which make a class an enum or an exception
+PARENT_ENUM_NAMES = (PARENT_ENUM_NAME, 'IntEnum', 'StrEnum', 'Flag', 'IntFlag')
+PARENT_EXCEPTION_NAMES = (PARENT_EXCEPTION_NAME, 'BaseException')
+CLASS_PREFIX = 'class '
+METHOD_PREFIX = 'def '
+ATTRIBUTE_PREFIX = 'self.'
+NAME_PREFIXES = (METHOD_PREFIX, ATTRIBUTE_PREFIX)
+DECORATOR_PREFIX = '@'
+INDENTATION_CHARACTERS = (' ', '\t')
+SELF_ARGUMENT_NAMES = ('self', 'cls')
+ARGUMENT_SEPARATORS = ('*', '/')
+OPENING_BRACKETS = '([{'
+CLOSING_BRACKETS = ')]}'
+VISIBILITY_BY_UNDERSCORE_COUNT = (PUBLIC, PROTECTED, PRIVATE)
+# Tokens after which a new statement starts, e.g. `self.x = 5` in `if foo: self.x = 5`
+STATEMENT_START_TOKEN_TYPES = (tokenize.NEWLINE, tokenize.NL, tokenize.INDENT, tokenize.DEDENT)
+STATEMENT_SEPARATORS = (':', ';')
+ATTRIBUTE_ASSIGNMENT_OPERATORS = ('=', ':')
+# Errors of the Python parser for source it cannot parse; on older versions such as Python 3.10,
+#   a null byte in the source raises ValueError instead of SyntaxError
+PARSE_ERRORS = (SyntaxError, ValueError)
 
 
 class MethodType(Enum):
@@ -40,136 +87,417 @@ class MethodType(Enum):
     ABSTRACT = 2
 
 
-def generate_models(file_contents: list[str]) -> list[ClassModel]:
+# In order of precedence, e.g. a static method is static even if it is also abstract
+DECORATOR_TO_METHOD_TYPE = {
+    STATIC_METHOD_NAME: MethodType.STATIC,
+    ABSTRACT_METHOD_NAME: MethodType.ABSTRACT
+}
+
+PARENT_TO_CLASS_TYPE = {
+    PARENT_ABSTRACT_NAME: ClassType.ABSTRACT,
+    PARENT_ABSTRACT_META_NAME: ClassType.ABSTRACT,
+    **dict.fromkeys(PARENT_ENUM_NAMES, ClassType.ENUM),
+    **dict.fromkeys(PARENT_EXCEPTION_NAMES, ClassType.EXCEPTION)
+}
+
+
+def generate_models(file_contents: Iterable[str]) -> Iterator[ClassModel]:
     """
     Generate the models from the Python code.
-    :param file_contents: The contents of the Python file.
-    :return: The models.
+    The classes are split like by split_classes, from the abstract syntax tree if the file is
+        valid Python. The models are yielded lazily, so the caller decides whether to hold them
+        all at once.
+    :param file_contents: The lines of the Python file.
+    :return: Iterator over the models.
     """
 
     classes_contents = split_classes(file_contents)
 
-    return [generate_model(class_content) for class_content in classes_contents]
+    for class_content in classes_contents:
+        yield generate_model(class_content)
+
+
+def generate_models_from_text(source: str) -> list[ClassModel]:
+    """
+    Generate the models from the whole text of a Python file.
+    The text is parsed as is, and only split into lines if it is not valid Python.
+    :param source: The source code of the Python file.
+    :return: The models.
+    """
+    try:
+        return generate_models_ast(source)
+    except PARSE_ERRORS:
+        # Fall back to the line-based parser for files which are not valid Python
+        return [generate_model(class_content) for class_content in iter_classes_text(source)]
 
 
 def generate_model(file_content: list[str]) -> ClassModel:
     """
     Generate a model from the Python code.
+    The class is parsed as a whole if it is valid Python, otherwise its lines are scanned.
     :param file_content: The contents of the Python file.
     :return: The model.
     """
+    if (class_node := parse_class_ast(file_content)) is not None:
+        return generate_model_ast(class_node)
 
-    class_name = get_class_name(file_content[0])
-    class_attributes = get_class_attributes(file_content)
-    methods = parsed_methods if (parsed_methods := get_methods(file_content)) else None
-    class_type = get_class_type(file_content[0])
+    return parse_class(file_content)
 
-    static_methods = result if (result := get_static_methods(file_content)) else None
-    abstract_methods = result if (result := get_abstract_methods(file_content)) else None
 
-    return ClassModel(class_name, class_attributes, methods, class_type,
-                      static_methods, abstract_methods)
+def parse_class(content: list[str]) -> ClassModel:
+    """
+    Parse a class which is not valid Python, scanning its tokens for the attributes like
+        get_class_attributes and its lines for the methods.
+    :param content: The contents of the class, starting with its definition.
+    :return: The model.
+    """
+    attributes = get_class_attributes(content)
+
+    methods = parse_grouped_methods(scan_methods(content))
+
+    return ClassModel(get_class_name(content[0]), attributes,
+                      methods[MethodType.METHOD] or None, get_class_type(content[0]),
+                      methods[MethodType.STATIC] or None, methods[MethodType.ABSTRACT] or None)
 
 
 # Class-related functions
-def split_classes(file_contents: list[str]) -> list[list[str]]:
+def split_classes(file_contents: Iterable[str]) -> list[list[str]]:
     """
     Split the file contents into a list of classes.
-    :param file_contents: The contents of the Python file.
+    The class boundaries come from the abstract syntax tree if the file is valid Python,
+        otherwise from the indentation of the lines.
+    :param file_contents: The lines of the Python file.
     :return: The list of classes.
     """
 
-    # Assume classes are defined at the top level
-    indexes_to_split_at = [i for i, line in enumerate(file_contents)
-                           if not (line.startswith(' ') or line.startswith('\t'))]
+    file_contents = list(file_contents)
+    if (tree := parse_source_ast(join_class_lines(file_contents))) is None:
+        return list(iter_classes(file_contents))
 
-    if len(indexes_to_split_at) == 0:
-        return []
+    return [file_contents[node.lineno - 1:node.end_lineno]
+            for node in tree.body if isinstance(node, ast.ClassDef)]
+
+
+def iter_classes(file_contents: Iterable[str]) -> Iterator[list[str]]:
+    """
+    Split the file contents into classes lazily, holding only the lines of the current class.
+    :param file_contents: The lines of the Python file.
+    :return: Iterator over the classes.
+    """
+
+    class_content = None
+
+    # Assume classes are defined at the top level; blank lines do not end a class
+    for line in file_contents:
+        if line.startswith(INDENTATION_CHARACTERS) or line.isspace() or not line:
+            if class_content is not None:
+                class_content.append(line)
+            continue
+
+        if class_content is not None:
+            yield class_content
+
+        # Lines of other top-level blocks are dropped instead of collected
+        is_class = line.startswith(CLASS_PREFIX) and class_pattern.match(line) is not None
+        class_content = [line] if is_class else None
 
-    zero_indentated_content = [file_contents[indexes_to_split_at[i]:indexes_to_split_at[i+1]]
-                               for i in range(len(indexes_to_split_at)-1)]
-    zero_indentated_content += [file_contents[indexes_to_split_at[-1]:]]
+    if class_content is not None:
+        yield class_content
 
-    return [content for content in zero_indentated_content if class_pattern.match(content[0])]
 
+def iter_classes_text(source: str) -> Iterator[list[str]]:
+    """
+    Split the whole text of a Python file into classes lazily.
+    The class definitions are found by a scan over the text, so only their lines are split.
+    :param source: The source code of the Python file.
+    :return: Iterator over the classes.
+    """
+
+    # Assume classes are defined at the top level
+    for header_match in class_header_pattern.finditer(source):
+        end_match = top_level_line_pattern.search(source, header_match.end())
+        end = end_match.start() if end_match is not None else len(source)
 
+        class_content = source[header_match.start():end].splitlines()
+        if class_pattern.match(class_content[0]):
+            yield class_content
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def get_class_name(content: str) -> str:
     """
     Get the name of the class.
     :param content: The contents of the Python file.
     :return: The name of the class.
     """
-    match class_name_pattern.match(content):
-        case re.Match() as match_result:
-            return match_result.group(1)
+    if (class_node := parse_class_header_ast(content)) is not None:
+        return class_node.name
+
+    # Fall back to the first two tokens for incomplete definitions such as `class Foo(Bar,`
+    tokens = tokenize.generate_tokens(io.StringIO(content.strip()).readline)
+    try:
+        header = [(token.type, token.string) for token in islice(tokens, 2)]
+    except (tokenize.TokenError, SyntaxError):
+        header = []
+
+    match header:
+        case [(tokenize.NAME, 'class'), (tokenize.NAME, name)]:
+            return sys.intern(name)
         case _:
             raise ValueError('No class name found')
 
 
-def get_class_attributes(content: list[str]) -> list[Variable]:
+def get_class_attributes(content: str | list[str]) -> list[Variable]:
     """
     Get the attributes of a class
     :param content: The contents of the Python file.
     :return: The attributes of the class.
     """
 
-    raw_attributes = extract_item(content, attribute_pattern)
+    source = join_class_lines(content)
+    if ATTRIBUTE_PREFIX not in source:
+        return []
+
+    return list(parse_class_attributes(source))
 
-    return [parse_attribute(raw_attribute) for raw_attribute in raw_attributes]
 
+@lru_cache(maxsize=CLASS_CACHE_SIZE)
+def parse_class_attributes(source: str) -> tuple[Variable, ...]:
+    """
+    Parse the attributes of a class, keeping the result for classes parsed again.
+    The class is parsed as a whole if it is valid Python, otherwise its tokens are scanned.
+    :param source: The source code of the class.
+    :return: The attributes of the class.
+    """
+    if (class_node := parse_class_ast(source)) is not None:
+        return tuple(get_class_attributes_ast(class_node))
 
+    # The visibility tells the underscores apart, so `self._x` and `self.x` are both kept
+    attributes: dict[tuple[str, Visibility], Variable] = {}
+    for raw_attribute in scan_attributes(source):
+        attribute = parse_attribute(raw_attribute)
+        attributes.setdefault((attribute.name, attribute.visibility), attribute)
+
+    return tuple(attributes.values())
+
+
+def scan_attributes(content: str | list[str]) -> list[str]:
+    """
+    Find the attribute assignments of a class with the tokenizer, so assignments inside strings
+        are skipped and ones following e.g. `if foo:` on the same line are found.
+    The tokens read before a tokenizer error are still scanned, as the class may be invalid.
+    :param content: The contents of the Python file.
+    :return: The raw attribute assignments, each from `self.` to the end of its line or the start
+        of the next assignment on it.
+    """
+    tokens = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(join_class_lines(content)).readline):
+            tokens.append(token)
+    except (tokenize.TokenError, SyntaxError):
+        pass
+
+    starts = []
+    for i, token in enumerate(tokens[:-3]):
+        is_assignment = (token.string == 'self' and tokens[i + 1].string == '.'
+                         and tokens[i + 2].type == tokenize.NAME
+                         and tokens[i + 3].string in ATTRIBUTE_ASSIGNMENT_OPERATORS)
+        is_statement_start = (i == 0 or tokens[i - 1].type in STATEMENT_START_TOKEN_TYPES
+                              or tokens[i - 1].string in STATEMENT_SEPARATORS)
+
+        if is_assignment and is_statement_start:
+            starts.append(token)
+
+    # Each assignment ends where the next one on the same line starts, so none is copied twice
+    raw_attributes = []
+    for i, token in enumerate(starts):
+        is_same_line = i + 1 < len(starts) and starts[i + 1].start[0] == token.start[0]
+        end = starts[i + 1].start[1] if is_same_line else None
+        raw_attributes.append(token.line[token.start[1]:end])
+
+    return raw_attributes
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def get_class_type(content: str) -> ClassType:
     """
     Get the type of the class.
     :param content: The contents of the Python file.
     :return: The type of the class.
     """
+    if (class_node := parse_class_header_ast(content)) is not None:
+        return parse_class_type(get_class_parents_ast(class_node))
+
     content = content.strip()
     match class_parents_pattern.match(content):
         case re.Match() as match_result:
-            class_type = match_result.group(1)
+            return parse_class_type(match_result['parents'])
         case None:
             return ClassType.CLASS
 
-    if PARENT_ABSTRACT_NAME in class_type:
-        return ClassType.ABSTRACT
-    if PARENT_ENUM_NAME in class_type:
-        return ClassType.ENUM
-    if PARENT_EXCEPTION_NAME in class_type:
-        return ClassType.EXCEPTION
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_class_type(parents: str) -> ClassType:
+    """
+    Parse the type of the class from its parents.
+    :param parents: The parents of the class, as written in the class definition.
+    :return: The type of the class.
+    """
+    for parent in parents.split(','):
+        # Drop the keyword of e.g. `metaclass=abc.ABCMeta` and the module of e.g. `enum.Enum`
+        parent_name = parent.rpartition('=')[2].strip().rpartition('.')[2]
+        if (class_type := PARENT_TO_CLASS_TYPE.get(parent_name)) is not None:
+            return class_type
 
     return ClassType.CLASS
 
 
 # Method-related functions
-def get_methods(content: list[str]) -> list[Method]:
+def get_methods(content: str | list[str]) -> list[Method]:
     """
     Get the methods of a class.
     :param content: The contents of the Python file.
     :return: The methods of the class.
     """
 
-    raw_methods = extract_item(content, method_pattern)
+    source = join_class_lines(content)
+    # Most data and enum classes have none, so skip parsing them with a cheap substring probe
+    if METHOD_PREFIX not in source:
+        return []
+
+    return list(get_methods_by_type(source)[MethodType.METHOD])
+
+
+@lru_cache(maxsize=CLASS_CACHE_SIZE)
+def get_methods_by_type(source: str) -> dict[MethodType, tuple[Method, ...]]:
+    """
+    Get the methods of a class of every type at once, so the getters of each type share
+        a single parse of the class.
+    The class is parsed as a whole if it is valid Python, otherwise its lines are scanned.
+    :param source: The source code of the class.
+    :return: The methods of the class, grouped by the type of the method.
+    """
+    if (class_node := parse_class_ast(source)) is not None:
+        methods = scan_methods_ast(class_node)
+    else:
+        methods = parse_grouped_methods(scan_methods(source.splitlines()))
+
+    return {method_type: tuple(methods[method_type]) for method_type in MethodType}
+
+
+def parse_grouped_methods(raw_methods: dict[MethodType, list[str]]
+                          ) -> dict[MethodType, list[Method]]:
+    """
+    Parse the methods of every type together, then regroup them by the type of the method.
+    :param raw_methods: The raw method definitions, grouped by the type of the method.
+    :return: The methods, grouped by the type of the method.
+    """
+    parsed_methods = iter(parse_methods([raw_method for method_type in MethodType
+                                         for raw_method in raw_methods[method_type]]))
+
+    return {method_type: list(islice(parsed_methods, len(raw_methods[method_type])))
+            for method_type in MethodType}
+
+
+def scan_methods(content: list[str]) -> dict[MethodType, list[str]]:
+    """
+    Find the method definitions of a class in a single pass over its lines, classifying each
+        method by the decorators preceding it.
+    :param content: The contents of the Python file.
+    :return: The raw method definitions, grouped by the type of the method.
+    """
+    raw_methods: dict[MethodType, list[str]] = {method_type: [] for method_type in MethodType}
+    decorator_names: set[str] = set()
+
+    for line in content:
+        stripped_line = line.lstrip()
+
+        if stripped_line.startswith(DECORATOR_PREFIX):
+            # Keep only the name, e.g. `abstractmethod` of `@abc.abstractmethod  # comment`
+            decorator_name = stripped_line[1:].partition('(')[0].partition('#')[0].strip()
+            decorator_names.add(f"{DECORATOR_PREFIX}{decorator_name.rpartition('.')[2]}")
+            continue
+
+        # Only run the pattern on the few lines which can be a definition
+        if not stripped_line.startswith(METHOD_PREFIX):
+            continue
+
+        match_result = method_line_pattern.match(stripped_line)
+        if match_result is None:
+            continue
+
+        raw_method = match_result[0]
+        method_type = get_method_type(decorator_names)
+        if method_type != MethodType.METHOD or method_pattern.match(raw_method):
+            raw_methods[method_type].append(raw_method)
+        decorator_names = set()
+
+    return raw_methods
+
+
+def get_method_type(decorator_names: set[str]) -> MethodType:
+    """
+    Get the type of a method from all of its decorators, taking the first type of
+        DECORATOR_TO_METHOD_TYPE whose decorator is present, so the order of the decorators
+        does not matter.
+    :param decorator_names: The names of the decorators of the method, e.g. '@staticmethod'.
+    :return: The type of the method.
+    """
+    for decorator_name, method_type in DECORATOR_TO_METHOD_TYPE.items():
+        if decorator_name in decorator_names:
+            return method_type
+
+    return MethodType.METHOD
+
+
+def parse_methods(raw_methods: list[str]) -> list[Method]:
+    """
+    Parse several methods from their raw strings with a single run of the Python parser.
+    If any of the definitions is incomplete, each method is parsed on its own instead.
+    :param raw_methods: The raw strings.
+    :return: The methods, in the same order.
+    """
+    if not raw_methods:
+        return []
+
+    stripped_methods = [raw_method.strip() for raw_method in raw_methods]
+    source = '\n'.join(f'{raw_method} ...' if raw_method.endswith(':') else raw_method
+                       for raw_method in stripped_methods)
+    try:
+        nodes = ast.parse(source).body
+    except PARSE_ERRORS:
+        nodes = []
+
+    # Each definition must have become exactly one function
+    function_nodes = [node for node in nodes if isinstance(node, ast.FunctionDef)]
+    if len(function_nodes) != len(nodes) or len(function_nodes) != len(stripped_methods):
+        return [parse_method(raw_method) for raw_method in stripped_methods]
 
-    return [parse_method(raw_method) for raw_method in raw_methods]
+    return [parse_method_ast(node, is_static=not has_self_argument_ast(node))
+            for node in function_nodes]
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_method(raw_method: str) -> Method:
     """
     Parse a method from the raw string.
+    The definition is parsed by the Python parser if it is complete, otherwise its text is split.
     :param raw_method: The raw string.
     :return: The method.
     """
     raw_method = raw_method.strip()
+    if (function_node := parse_method_header_ast(raw_method)) is not None:
+        return parse_method_ast(function_node, is_static=not has_self_argument_ast(function_node))
+
     match method_name_pattern.match(raw_method):
         case re.Match() as match_result:
-            method_name = match_result.group(1)
+            method_name = sys.intern(match_result['name'])
         case None:
             method_name = ''
 
     method_visibility = parse_visibility(raw_method)
 
-    method_arguments = arguments if (arguments := parse_arguments(raw_method)) else None
+    method_arguments = arguments if (arguments := parse_arguments_text(raw_method)) else None
     method_return_type = return_type if (return_type := parse_return_type(raw_method)) else None
 
     return Method(method_name, method_visibility, method_arguments, method_return_type)
@@ -178,26 +506,101 @@ def parse_method(raw_method: str) -> Method:
 def parse_arguments(raw_method: str) -> list[Variable]:
     """
     Parse the arguments of a method from the raw string.
-    :param raw_arguments: The raw string.
-    :return: The arguments.
+    :param raw_method: The raw string.
+    :return: The arguments, without `self`/`cls`.
     """
     raw_method = raw_method.strip()
-    arguments_pattern = re.compile(r'\((.*)\)')
+    if (function_node := parse_method_header_ast(raw_method)) is not None:
+        return parse_arguments_ast(function_node.args,
+                                   is_static=not has_self_argument_ast(function_node))
+
+    return parse_arguments_text(raw_method)
+
+
+def parse_arguments_text(raw_method: str) -> list[Variable]:
+    """
+    Parse the arguments of a method by splitting the raw string,
+        e.g. for the first line of a multi-line definition.
+    :param raw_method: The stripped raw string.
+    :return: The arguments, without `self`/`cls`.
+    """
+    # From the first opening to the last closing parenthesis, found in linear time
+    start, end = raw_method.find('('), raw_method.rfind(')')
+    if start == -1 or end < start:
+        return []
+
+    raw_arguments = raw_method[start + 1:end]
+
+    if not any(bracket in raw_arguments for bracket in OPENING_BRACKETS):
+        # Without brackets no comma is nested in a type, so a single sweep finds every argument
+        parsed_arguments = [
+            make_variable(sys.intern(match_result['name']),
+                          parse_name_visibility(match_result['name'].lstrip('*')),
+                          sys.intern((match_result['type'] or '').strip()))
+            for match_result in argument_item_pattern.finditer(raw_arguments)]
+    else:
+        parsed_arguments = [parse_argument(argument) for argument in split_arguments(raw_arguments)
+                            if argument not in ARGUMENT_SEPARATORS]
+
+    if parsed_arguments and parsed_arguments[0].name in SELF_ARGUMENT_NAMES:
+        parsed_arguments = parsed_arguments[1:]
+
+    return parsed_arguments
+
+
+def split_arguments(raw_arguments: str) -> list[str]:
+    """
+    Split the raw arguments of a method on the commas which are not inside brackets,
+        so that types such as `dict[str, int]` are kept whole.
+    :param raw_arguments: The raw string between the parentheses of the method.
+    :return: The raw arguments.
+    """
+    if not any(bracket in raw_arguments for bracket in OPENING_BRACKETS):
+        arguments = raw_arguments.split(',')
+    else:
+        arguments = []
+        depth = 0
+        start = 0
+        for i, character in enumerate(raw_arguments):
+            if character in OPENING_BRACKETS:
+                depth += 1
+            elif character in CLOSING_BRACKETS:
+                depth -= 1
+            elif character == ',' and depth == 0:
+                arguments.append(raw_arguments[start:i])
+                start = i + 1
+        arguments.append(raw_arguments[start:])
+
+    return [stripped for argument in arguments if (stripped := argument.strip())]
+
 
-    match arguments_pattern.match(raw_method):
+def parse_argument(raw_argument: str) -> Variable:
+    """
+    Parse an argument of a method from the raw string.
+    :param raw_argument: The raw string, e.g. `a: int = 5`.
+    :return: The argument.
+    """
+    if not raw_argument.lstrip().lstrip('*')[:1].isidentifier():
+        raise ValueError('No argument name found')
+
+    match argument_name_pattern.match(raw_argument):
         case re.Match() as match_result:
-            raw_arguments: str = match_result.group(1)
+            argument_name = sys.intern(match_result['name'])
         case None:
-            return []
+            raise ValueError('No argument name found')
 
-    arguments = raw_arguments.split(',')
-    arguments = [argument.strip() for argument in arguments]
+    argument_visibility = parse_name_visibility(argument_name.lstrip('*'))
 
-    parsed_arguments = [parse_attribute(argument) for argument in arguments]
+    match argument_type_pattern.match(raw_argument):
+        case re.Match() as match_result:
+            argument_type = sys.intern(match_result['type'].strip())
+        case None:
+            argument_type = ''
 
-    return parsed_arguments
+    return make_variable(argument_name, argument_visibility, argument_type)
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_return_type(raw_method: str) -> str:
     """
     Parse the return type of a method from the raw string.
@@ -207,86 +610,391 @@ def parse_return_type(raw_method: str) -> str:
     raw_method = raw_method.strip()
     match method_return_type_pattern.match(raw_method):
         case re.Match() as match_result:
-            return_type = match_result.group(1).strip()
+            return_type = sys.intern(match_result['return_type'].strip())
         case None:
             return_type = ''
 
     return return_type
 
 
-def get_static_methods(content: list[str]) -> list[Method]:
+def get_static_methods(content: str | list[str]) -> list[Method]:
     """
     Get the static methods of a class.
     :param content: The contents of the Python file.
     :return: The static methods of the class.
     """
-    raw_methods = [content[i+1] for i, line in enumerate(content) if STATIC_METHOD_NAME in line]
+    source = join_class_lines(content)
+    if METHOD_PREFIX not in source:
+        return []
 
-    return [parse_method(raw_method) for raw_method in raw_methods]
+    return list(get_methods_by_type(source)[MethodType.STATIC])
 
 
-def get_abstract_methods(content: list[str]) -> list[Method]:
+def get_abstract_methods(content: str | list[str]) -> list[Method]:
     """
     Get the abstract methods of a class.
     :param content: The contents of the Python file.
     :return: The abstract methods of the class.
     """
-    raw_methods = [content[i+1] for i, line in enumerate(content) if ABSTRACT_METHOD_NAME in line]
+    source = join_class_lines(content)
+    if METHOD_PREFIX not in source:
+        return []
 
-    return [parse_method(raw_method) for raw_method in raw_methods]
+    return list(get_methods_by_type(source)[MethodType.ABSTRACT])
 
 
 # Utils
-def parse_visibility(raw_attribute) -> Visibility:
+def join_class_lines(content: str | list[str]) -> str:
+    """
+    Join the lines of a class into its source code, unless it is given as source code already.
+    :param content: The contents of the class, as lines or as a single string.
+    :return: The source code of the class.
+    """
+    if isinstance(content, str):
+        return content
+
+    return '\n'.join(line.rstrip('\r\n') for line in content)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def make_variable(name: str, visibility: Visibility, variable_type: str) -> Variable:
+    """
+    Create a variable, sharing a single instance between equal variables.
+    Arguments such as `name: str` repeat across methods, and the variables are immutable,
+        so comparing them mostly falls back to an identity check.
+    :param name: The name of the variable.
+    :param visibility: The visibility of the variable.
+    :param variable_type: The type of the variable.
+    :return: The variable.
     """
-    Parse the visibility of an attribute.
+    return Variable(name, visibility, variable_type)
+
+
+def parse_visibility(raw_attribute: str) -> Visibility:
+    """
+    Parse the visibility of an attribute or a method from its leading underscores.
     :param raw_attribute: The raw string.
     :return: The visibility of the attribute.
     """
-    underscore_count = raw_attribute.count('_')
+    name = raw_attribute.strip()
+    for prefix in NAME_PREFIXES:
+        if name.startswith(prefix):
+            name = name[len(prefix):].lstrip()
+            break
 
-    if underscore_count == 0:
-        visibility = Visibility.PUBLIC
-    elif underscore_count == 1:
-        visibility = Visibility.PROTECTED
-    else:
-        # Having multiple underscores is valid in python - assume private
-        visibility = Visibility.PRIVATE
-    return visibility
+    return parse_name_visibility(name)
 
 
-def extract_item(content: list[str], item_pattern: Pattern) -> list[str]:
+def parse_name_visibility(name: str) -> Visibility:
     """
-    Extract an item from the raw string.
-    :param raw_item: The raw string.
-    :return: The extracted item.
+    Parse the visibility of a bare name, e.g. `_foo`.
+    :param name: The name of the attribute, method or argument.
+    :return: The visibility of the name.
     """
-    result = [match_result.group(0) for line in content
-              if (match_result := item_pattern.match(line)) is not None]
+    # Having multiple underscores is valid in python - assume private, so only the first two
+    #   characters are checked instead of stripping all the underscores
+    underscore_count = name.startswith('_') + name.startswith('__')
+    return VISIBILITY_BY_UNDERSCORE_COUNT[underscore_count]
 
-    return result
+
+def split_name_underscores(raw_name: str) -> tuple[str, str]:
+    """
+    Split at most two leading underscores off a name, like `attribute_declaration_pattern`,
+        so `___foo` is split into `__` and `_foo`.
+    :param raw_name: The name as written, e.g. `__foo`.
+    :return: The leading underscores and the rest of the name.
+    """
+    underscore_count = min(len(raw_name) - len(raw_name.lstrip('_')), 2, len(raw_name) - 1)
+    return raw_name[:underscore_count], raw_name[underscore_count:]
 
 
-def parse_attribute(raw_attribute: str) -> Variable:
+def parse_attribute(raw_attribute: str,
+                    visibility_parser: Callable[[str], Visibility] = parse_name_visibility
+                    ) -> Variable:
     """
     Parse an attribute from the raw string.
     :param raw_attribute: The raw string.
+    :param visibility_parser: Function parsing the visibility from the leading underscores.
     :return: The attribute.
     """
 
     raw_attribute = raw_attribute.strip()
-    match attribute_name_pattern.match(raw_attribute):
+    if not raw_attribute.startswith(ATTRIBUTE_PREFIX):
+        raise ValueError('No attribute name found')
+
+    match attribute_declaration_pattern.match(raw_attribute):
         case re.Match() as match_result:
-            attribute_name = match_result.group(2)
+            attribute_name = sys.intern(match_result['name'])
+            attribute_visibility = visibility_parser(match_result['underscores'])
+            attribute_type = sys.intern((match_result['type'] or '').strip())
         case None:
             raise ValueError('No attribute name found')
 
-    attribute_visibility = parse_visibility(raw_attribute)
+    return make_variable(attribute_name, attribute_visibility, attribute_type)
 
-    match attribute_type_pattern.match(raw_attribute):
-        case re.Match() as match_result:
-            attribute_type = match_result.group(1)
-        case None:
-            attribute_type = ''
 
-    return Variable(attribute_name, attribute_visibility, attribute_type)
+# AST-related functions
+def generate_models_ast(source: str) -> list[ClassModel]:
+    """
+    Generate the models from the Python code, using the abstract syntax tree of the code.
+    :param source: The source code of the Python file.
+    :return: The models.
+    :raises SyntaxError: If the source code cannot be parsed.
+    :raises ValueError: If the source code contains null bytes, on older versions of Python.
+    """
+    tree = ast.parse(source)
+
+    return [generate_model_ast(node) for node in tree.body if isinstance(node, ast.ClassDef)]
+
+
+def generate_model_ast(class_node: ast.ClassDef) -> ClassModel:
+    """
+    Generate a model from a class definition node.
+    :param class_node: The class definition node.
+    :return: The model.
+    """
+    class_type = parse_class_type(get_class_parents_ast(class_node))
+
+    methods = scan_methods_ast(class_node)
+
+    return ClassModel(class_node.name, get_class_attributes_ast(class_node),
+                      methods[MethodType.METHOD] or None, class_type,
+                      methods[MethodType.STATIC] or None, methods[MethodType.ABSTRACT] or None)
+
+
+def get_class_parents_ast(class_node: ast.ClassDef) -> str:
+    """
+    Get the parents of a class back as source, including keywords such as `metaclass=ABCMeta`.
+    :param class_node: The class definition node.
+    :return: The parents of the class, separated by commas.
+    """
+    return ', '.join(ast.unparse(parent) for parent in class_node.bases + class_node.keywords)
+
+
+def parse_class_header_ast(raw_class: str) -> Optional[ast.ClassDef]:
+    """
+    Parse a single class definition line, e.g. `class Foo(Bar, metaclass=ABCMeta):`.
+    The body is added on a line of its own, so a trailing comment does not swallow it.
+    :param raw_class: The class definition line.
+    :return: The class definition node, or None if the line is not a complete definition.
+    """
+    try:
+        tree = ast.parse(f'{raw_class.strip()}\n    ...')
+    except PARSE_ERRORS:
+        return None
+
+    match tree.body:
+        case [ast.ClassDef() as class_node]:
+            return class_node
+        case _:
+            return None
+
+
+def parse_class_ast(content: str | list[str]) -> Optional[ast.ClassDef]:
+    """
+    Parse the contents of a single class.
+    :param content: The contents of the class, starting with its definition.
+    :return: The class definition node, or None if the contents are not a valid class.
+    """
+    match parse_source_ast(join_class_lines(content)):
+        case ast.Module(body=[ast.ClassDef() as class_node]):
+            return class_node
+        case _:
+            return None
+
+
+@lru_cache(maxsize=CLASS_CACHE_SIZE)
+def parse_source_ast(source: str) -> Optional[ast.Module]:
+    """
+    Parse source code, keeping the tree for the same source parsed again, e.g. by the getters
+        of the attributes and of the methods of one class.
+    The trees are shared between the callers, so they must not be modified.
+    :param source: The source code.
+    :return: The module node, or None if the source is not valid Python.
+    """
+    try:
+        return ast.parse(source)
+    except PARSE_ERRORS:
+        return None
+
+
+def scan_methods_ast(class_node: ast.ClassDef) -> dict[MethodType, list[Method]]:
+    """
+    Get the methods of a class, grouped by the type of the method.
+    :param class_node: The class definition node.
+    :return: The methods of the class, grouped by the type of the method.
+    """
+    methods: dict[MethodType, list[Method]] = {method_type: [] for method_type in MethodType}
+
+    for node in class_node.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+
+        method_type = get_method_type(get_decorator_names_ast(node))
+        is_static = method_type == MethodType.STATIC
+        methods[method_type].append(parse_method_ast(node, is_static=is_static))
+
+    return methods
+
+
+def get_class_attributes_ast(class_node: ast.ClassDef) -> list[Variable]:
+    """
+    Get the attributes of a class, assigned through `self` in any of its methods.
+    :param class_node: The class definition node.
+    :return: The attributes of the class, in order of their first assignment.
+    """
+    visitor = AttributeVisitor()
+    # `self` only exists inside the methods, so statements such as enum members are not visited
+    for node in class_node.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            visitor.visit(node)
+
+    return list(visitor.attributes.values())
+
+
+class AttributeVisitor(ast.NodeVisitor):
+    """
+    Visitor which collects the attributes assigned through `self` in the methods of a class.
+    Nested classes are not visited, as `self` in their methods is another object.
+    """
+    def __init__(self):
+        self.attributes: dict[str, Variable] = {}
+
+    def visit_ClassDef(self, node: ast.ClassDef):  # pylint: disable=invalid-name
+        """
+        Skip a nested class.
+        :param node: The class definition node.
+        """
+
+    def visit_Assign(self, node: ast.Assign):  # pylint: disable=invalid-name
+        """
+        Collect the attributes assigned by an assignment, e.g. `self.x = self.y = 5`.
+        :param node: The assignment node.
+        """
+        for target in node.targets:
+            self.add_target(target, None)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign):  # pylint: disable=invalid-name
+        """
+        Collect the attribute assigned by an annotated assignment, e.g. `self.x: int = 5`.
+        :param node: The annotated assignment node.
+        """
+        self.add_target(node.target, node.annotation)
+
+    def add_target(self, target: ast.expr, annotation: Optional[ast.expr]):
+        """
+        Collect the attributes of an assignment target, unpacking tuples such as `self.x, y`.
+        The first assignment of each attribute is kept.
+        :param target: The assignment target node.
+        :param annotation: The annotation of the assignment, if any.
+        """
+        match target:
+            case ast.Tuple(elts=elements) | ast.List(elts=elements):
+                for element in elements:
+                    self.add_target(element, annotation)
+            case ast.Attribute(value=ast.Name(id='self'), attr=raw_name):
+                # Keyed on the name as written, so `self._x` and `self.x` are both kept
+                if raw_name not in self.attributes:
+                    underscores, name = split_name_underscores(raw_name)
+                    self.attributes[raw_name] = make_variable(
+                        sys.intern(name), parse_name_visibility(underscores),
+                        parse_annotation_ast(annotation))
+
+
+def get_decorator_names_ast(function_node: ast.FunctionDef | ast.AsyncFunctionDef) -> set[str]:
+    """
+    Get the names of the decorators of a function, e.g. '@staticmethod'.
+    :param function_node: The function definition node.
+    :return: The names of the decorators.
+    """
+    names = set()
+
+    for decorator in function_node.decorator_list:
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+
+        match decorator:
+            case ast.Name(id=name) | ast.Attribute(attr=name):
+                names.add(f'@{name}')
+
+    return names
+
+
+def parse_method_ast(function_node: ast.FunctionDef | ast.AsyncFunctionDef,
+                     is_static: bool = False) -> Method:
+    """
+    Parse a method from a function definition node.
+    :param function_node: The function definition node.
+    :param is_static: Whether the method is static, i.e. has no `self`/`cls` argument.
+    :return: The method.
+    """
+    arguments = parse_arguments_ast(function_node.args, is_static)
+    return_type = parse_annotation_ast(function_node.returns) or None
+
+    return Method(function_node.name, parse_name_visibility(function_node.name),
+                  arguments or None, return_type)
+
+
+def parse_arguments_ast(arguments_node: ast.arguments, is_static: bool = False) -> list[Variable]:
+    """
+    Parse the arguments of a method from its arguments node.
+    :param arguments_node: The arguments node of the function definition.
+    :param is_static: Whether the method is static, i.e. has no `self`/`cls` argument.
+    :return: The arguments, without `self`/`cls`.
+    """
+    raw_arguments = [('', argument) for argument in
+                     arguments_node.posonlyargs + arguments_node.args]
+    if not is_static:
+        raw_arguments = raw_arguments[1:]
+    if arguments_node.vararg is not None:
+        raw_arguments.append(('*', arguments_node.vararg))
+    raw_arguments += [('', argument) for argument in arguments_node.kwonlyargs]
+    if arguments_node.kwarg is not None:
+        raw_arguments.append(('**', arguments_node.kwarg))
+
+    return [make_variable(sys.intern(prefix + argument.arg), parse_name_visibility(argument.arg),
+                          parse_annotation_ast(argument.annotation))
+            for prefix, argument in raw_arguments]
+
+
+def has_self_argument_ast(function_node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    """
+    Check whether the first argument of a function is `self`/`cls`.
+    :param function_node: The function definition node.
+    :return: True if the function takes `self`/`cls`, False otherwise.
+    """
+    positional_arguments = function_node.args.posonlyargs + function_node.args.args
+
+    return bool(positional_arguments) and positional_arguments[0].arg in SELF_ARGUMENT_NAMES
+
+
+def parse_method_header_ast(raw_method: str) -> Optional[ast.FunctionDef]:
+    """
+    Parse a single method definition line, e.g. `def foo(self, a: int) -> str:`.
+    :param raw_method: The stripped method definition line.
+    :return: The function definition node, or None if the line is not a complete definition.
+    """
+    source = f'{raw_method} ...' if raw_method.endswith(':') else raw_method
+    try:
+        tree = ast.parse(source)
+    except PARSE_ERRORS:
+        return None
+
+    match tree.body:
+        case [ast.FunctionDef() as function_node]:
+            return function_node
+        case _:
+            return None
+
+
+def parse_annotation_ast(annotation: Optional[ast.expr]) -> str:
+    """
+    Parse a type annotation node back to source.
+    The result is interned, as the same few types are repeated across a whole code base.
+    :param annotation: The annotation node, if any.
+    :return: The type, or an empty string if there is no annotation.
+    """
+    if annotation is None:
+        return ''
+
+    return sys.intern(ast.unparse(annotation))
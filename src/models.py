@@ -26,6 +26,10 @@ class Visibility(Enum):
     PROTECTED = 2
 
 
+# Module-level aliases, so the parsers never look the members up on the Enum class
+PUBLIC, PRIVATE, PROTECTED = Visibility.PUBLIC, Visibility.PRIVATE, Visibility.PROTECTED
+
+
 class LinkType(Enum):
     """
     Enum class to represent the type of a link.
@@ -36,7 +40,7 @@ class LinkType(Enum):
     NORMAL = 3
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Variable:
     """
     Data class to represent a variable
@@ -46,7 +50,7 @@ class Variable:
     variable_type: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Method:
     """
     Data class to represent a method of a class.
@@ -61,6 +65,9 @@ class ClassModel:
     """
     Class to represent a class.
     """
+    __slots__ = ('__name', '__attributes', '__methods', '__class_type',
+                 '__static_methods', '__abstract_methods')
+
     def __init__(self, name: str, attributes: Optional[list[Variable]],
                  methods: Optional[list[Method]], class_type: ClassType,
                  static_methods: Optional[list[Method]],
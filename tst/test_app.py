@@ -0,0 +1,233 @@
+"""
+Module containing the tests for the app module.
+"""
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+import src.app as app
+
+
+class TestGenerateUmlClassDiagram(unittest.TestCase):
+    """
+    Test cases for the generate_uml_class_diagram function.
+    """
+    def setUp(self):
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        self.__output_dir = os.path.join(self.__temporary_dir.name, 'output')
+
+    def tearDown(self):
+        self.__temporary_dir.cleanup()
+
+    def __create_source_files(self, count: int) -> list[str]:
+        source_files = []
+        for i in range(count):
+            source_file = os.path.join(self.__temporary_dir.name, f'source_{i}.py')
+            with open(source_file, 'w', encoding='utf-8') as file:
+                file.write(f'class Foo{i}:\n    pass\n')
+            source_files.append(source_file)
+
+        return source_files
+
+    def __read_diagram(self) -> str:
+        with open(os.path.join(self.__output_dir, 'diagram.puml'), 'r', encoding='utf-8') as file:
+            return file.read()
+
+    @patch('src.app.ProcessPoolExecutor')
+    @patch('builtins.print')
+    def test_01_few_files_serial(self, _, mocked_executor):
+        """
+        Verify that a few files are processed without starting worker processes
+        """
+        # Arrange
+        source_files = self.__create_source_files(2)
+
+        # Act
+        app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=None)
+
+        # Assert
+        mocked_executor.assert_not_called()
+        self.assertIn('class Foo0 {', self.__read_diagram())
+        self.assertIn('class Foo1 {', self.__read_diagram())
+
+    @patch('builtins.print')
+    def test_02_many_files_parallel(self, _):
+        """
+        Verify that many files processed in parallel keep the order of the source files
+        """
+        # Arrange
+        source_files = self.__create_source_files(app.PARALLEL_FILES_THRESHOLD)
+
+        # Act
+        app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=None)
+
+        # Assert
+        diagram = self.__read_diagram()
+        positions = [diagram.index(f'class Foo{i} {{') for i in range(len(source_files))]
+        self.assertEqual(positions, sorted(positions))
+
+    @patch('builtins.print')
+    def test_03_unchanged_files_not_read(self, _):
+        """
+        Verify that files unchanged since the last run are not read again
+        """
+        # Arrange
+        source_files = self.__create_source_files(2)
+        cache_dir = os.path.join(self.__temporary_dir.name, 'cache')
+        app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=cache_dir)
+
+        # Act
+        with patch('src.cache.get_cache_key') as mocked_get_cache_key:
+            app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=cache_dir)
+
+        # Assert
+        mocked_get_cache_key.assert_not_called()
+        self.assertIn('class Foo0 {', self.__read_diagram())
+        self.assertIn('class Foo1 {', self.__read_diagram())
+
+    @patch('builtins.print')
+    def test_04_changed_file_rebuilt(self, _):
+        """
+        Verify that a file changed since the last run is parsed again
+        """
+        # Arrange
+        source_files = self.__create_source_files(1)
+        cache_dir = os.path.join(self.__temporary_dir.name, 'cache')
+        app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=cache_dir)
+        with open(source_files[0], 'w', encoding='utf-8') as file:
+            file.write('class Changed:\n    pass\n')
+
+        # Act
+        app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=cache_dir)
+
+        # Assert
+        self.assertIn('class Changed {', self.__read_diagram())
+        self.assertNotIn('class Foo0 {', self.__read_diagram())
+
+    @patch('src.app.ProcessPoolExecutor')
+    @patch('builtins.print')
+    def test_05_single_job_serial(self, _, mocked_executor):
+        """
+        Verify that many files are processed without starting worker processes when limited
+            to a single job
+        """
+        # Arrange
+        source_files = self.__create_source_files(app.PARALLEL_FILES_THRESHOLD)
+
+        # Act
+        app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=None, jobs=1)
+
+        # Assert
+        mocked_executor.assert_not_called()
+        self.assertIn('class Foo0 {', self.__read_diagram())
+
+    @patch('src.app.ProcessPoolExecutor')
+    @patch('builtins.print')
+    def test_06_jobs_workers(self, _, mocked_executor):
+        """
+        Verify that the number of jobs is used as the number of worker processes
+        """
+        # Arrange
+        source_files = self.__create_source_files(app.PARALLEL_FILES_THRESHOLD)
+        mocked_executor.return_value.__enter__.return_value.map.return_value = []
+
+        # Act
+        app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=None, jobs=3)
+
+        # Assert
+        mocked_executor.assert_called_once_with(max_workers=3)
+
+    @patch('builtins.print')
+    def test_07_other_version_rebuilt(self, _):
+        """
+        Verify that unchanged files are parsed again when the cache was filled by another version
+        """
+        # Arrange
+        source_files = self.__create_source_files(1)
+        cache_dir = os.path.join(self.__temporary_dir.name, 'cache')
+        with patch('src.cache.__version__', '0.0'):
+            app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=cache_dir)
+
+        # Act
+        with patch('src.converters.python_to_model.generate_models_from_text',
+                   return_value=[]) as mocked_generate_models:
+            app.generate_uml_class_diagram(source_files, self.__output_dir, cache_dir=cache_dir)
+
+        # Assert
+        mocked_generate_models.assert_called_once()
+
+    def test_08_non_positive_jobs(self):
+        """
+        Verify that a number of jobs below one is rejected
+        """
+        # Arrange
+        source_files = self.__create_source_files(app.PARALLEL_FILES_THRESHOLD)
+
+        for jobs in (0, -2):
+            with self.subTest(jobs=jobs):
+                # Act & assert
+                with self.assertRaises(ValueError):
+                    app.generate_uml_class_diagram(source_files, self.__output_dir,
+                                                   cache_dir=None, jobs=jobs)
+
+
+class TestGenerateFileModels(unittest.TestCase):
+    """
+    Test cases for the generate_file_models function.
+    """
+    @patch('src.converters.python_to_model.generate_models_from_text')
+    @patch('src.cache.load_models')
+    def test_01_cache_disabled(self, mocked_load_models, mocked_generate_models):
+        """
+        Verify that generate_file_models does not touch the cache when it is disabled
+        """
+        # Arrange
+        mocked_generate_models.return_value = []
+
+        # Act
+        app.generate_file_models('class Foo:\n    pass\n', None)
+
+        # Assert
+        mocked_load_models.assert_not_called()
+        mocked_generate_models.assert_called_once()
+
+    @patch('src.converters.python_to_model.generate_models_from_text')
+    @patch('src.cache.store_models')
+    @patch('src.cache.load_models')
+    def test_02_cache_hit(self, mocked_load_models, mocked_store_models, mocked_generate_models):
+        """
+        Verify that generate_file_models returns the cached models without parsing the source
+        """
+        # Arrange
+        mocked_load_models.return_value = ['cached']
+
+        # Act
+        result = app.generate_file_models('class Foo:\n    pass\n', 'cache')
+
+        # Assert
+        self.assertEqual(result, ['cached'])
+        mocked_generate_models.assert_not_called()
+        mocked_store_models.assert_not_called()
+
+    @patch('src.converters.python_to_model.generate_models_from_text')
+    @patch('src.cache.store_models')
+    @patch('src.cache.load_models')
+    def test_03_cache_miss(self, mocked_load_models, mocked_store_models, mocked_generate_models):
+        """
+        Verify that generate_file_models parses the source and stores the models on a cache miss
+        """
+        # Arrange
+        source = 'class Foo:\n    pass\n'
+        mocked_load_models.return_value = None
+        mocked_generate_models.return_value = ['generated']
+
+        # Act
+        result = app.generate_file_models(source, 'cache')
+
+        # Assert
+        self.assertEqual(result, ['generated'])
+        mocked_generate_models.assert_called_once_with(source)
+        mocked_store_models.assert_called_once_with('cache', app.cache.get_cache_key(source),
+                                                    ['generated'])
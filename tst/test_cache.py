@@ -0,0 +1,247 @@
+"""
+Module containing the tests for the cache module.
+"""
+import os
+import tempfile
+import unittest
+
+from unittest.mock import patch
+
+import src.cache as cache
+
+from src.models import ClassModel, ClassType, Variable, Visibility
+
+
+class TestGetCacheKey(unittest.TestCase):
+    """
+    Test cases for the get_cache_key function.
+    """
+    def test_01_same_source(self):
+        """
+        Verify that get_cache_key returns the same key for the same source
+        """
+        # Act
+        first_key = cache.get_cache_key('class Foo:\n    pass\n')
+        second_key = cache.get_cache_key('class Foo:\n    pass\n')
+
+        # Assert
+        self.assertEqual(first_key, second_key)
+
+    def test_02_different_source(self):
+        """
+        Verify that get_cache_key returns different keys for different sources
+        """
+        # Act
+        first_key = cache.get_cache_key('class Foo:\n    pass\n')
+        second_key = cache.get_cache_key('class Bar:\n    pass\n')
+
+        # Assert
+        self.assertNotEqual(first_key, second_key)
+
+    def test_03_different_version(self):
+        """
+        Verify that get_cache_key returns a different key for another version of Py2UML
+        """
+        # Arrange
+        source = 'class Foo:\n    pass\n'
+        current_key = cache.get_cache_key(source)
+
+        # Act
+        with patch('src.cache.__version__', '0.0'):
+            other_key = cache.get_cache_key(source)
+
+        # Assert
+        self.assertNotEqual(current_key, other_key)
+
+
+class TestGetDefaultCacheDir(unittest.TestCase):
+    """
+    Test cases for the get_default_cache_dir function.
+    """
+    @patch('os.name', 'posix')
+    def test_01_xdg_cache_home(self):
+        """
+        Verify that get_default_cache_dir uses XDG_CACHE_HOME when it is set
+        """
+        # Act
+        with patch.dict(os.environ, {'XDG_CACHE_HOME': '/xdg'}):
+            result = cache.get_default_cache_dir()
+
+        # Assert
+        self.assertEqual(result, os.path.join('/xdg', cache.CACHE_DIR_NAME))
+
+    @patch('os.name', 'posix')
+    def test_02_home_cache(self):
+        """
+        Verify that get_default_cache_dir falls back to the cache directory in the home directory
+        """
+        # Act
+        with patch.dict(os.environ, {'XDG_CACHE_HOME': ''}):
+            result = cache.get_default_cache_dir()
+
+        # Assert
+        self.assertEqual(result, os.path.join(os.path.expanduser('~'), '.cache',
+                                              cache.CACHE_DIR_NAME))
+
+
+class TestLoadStoreModels(unittest.TestCase):
+    """
+    Test cases for the load_models and store_models functions.
+    """
+    def setUp(self):
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        self.__cache_dir = os.path.join(self.__temporary_dir.name, 'cache')
+
+    def tearDown(self):
+        self.__temporary_dir.cleanup()
+
+    def test_01_missing_entry(self):
+        """
+        Verify that load_models returns None when nothing has been cached
+        """
+        # Act
+        result = cache.load_models(self.__cache_dir, 'missing')
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_02_stored_entry(self):
+        """
+        Verify that load_models returns the models stored by store_models
+        """
+        # Arrange
+        attributes = [Variable('x', Visibility.PUBLIC, 'int')]
+        models = [ClassModel('Foo', attributes, None, ClassType.CLASS, None, None)]
+
+        # Act
+        cache.store_models(self.__cache_dir, 'key', models)
+        result = cache.load_models(self.__cache_dir, 'key')
+
+        # Assert
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].name, 'Foo')
+        self.assertEqual(result[0].attributes, attributes)
+        self.assertEqual(os.listdir(self.__cache_dir), ['key' + cache.CACHE_FILE_EXTENSION])
+
+    def test_03_corrupted_entry(self):
+        """
+        Verify that load_models returns None when the cached entry cannot be read
+        """
+        # Arrange
+        os.makedirs(self.__cache_dir)
+        with open(cache.get_cache_path(self.__cache_dir, 'key'), 'wb') as file:
+            file.write(b'not a pickle')
+
+        # Act
+        result = cache.load_models(self.__cache_dir, 'key')
+
+        # Assert
+        self.assertIsNone(result)
+
+
+class TestLoadStoreManifest(unittest.TestCase):
+    """
+    Test cases for the load_manifest and store_manifest functions.
+    """
+    def setUp(self):
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        self.__cache_dir = os.path.join(self.__temporary_dir.name, 'cache')
+
+    def tearDown(self):
+        self.__temporary_dir.cleanup()
+
+    def test_01_missing_manifest(self):
+        """
+        Verify that load_manifest returns an empty manifest when none has been stored
+        """
+        # Act
+        result = cache.load_manifest(self.__cache_dir)
+
+        # Assert
+        self.assertEqual(result, {})
+
+    def test_02_stored_manifest(self):
+        """
+        Verify that load_manifest returns the manifest stored by store_manifest
+        """
+        # Arrange
+        manifest = {'/src/foo.py': (1, 2, 'key')}
+
+        # Act
+        cache.store_manifest(self.__cache_dir, manifest)
+        result = cache.load_manifest(self.__cache_dir)
+
+        # Assert
+        self.assertEqual(result, manifest)
+
+    def test_03_corrupted_manifest(self):
+        """
+        Verify that load_manifest returns an empty manifest when it cannot be read
+        """
+        # Arrange
+        os.makedirs(self.__cache_dir)
+        with open(os.path.join(self.__cache_dir, cache.MANIFEST_FILE_NAME), 'w',
+                  encoding='utf-8') as file:
+            file.write('{"/src/foo.py": 1}')
+
+        # Act
+        result = cache.load_manifest(self.__cache_dir)
+
+        # Assert
+        self.assertEqual(result, {})
+
+    def test_04_other_version_manifest(self):
+        """
+        Verify that load_manifest returns an empty manifest when it was stored by another version
+        """
+        # Arrange
+        with patch('src.cache.__version__', '0.0'):
+            cache.store_manifest(self.__cache_dir, {'/src/foo.py': (1, 2, 'key')})
+
+        # Act
+        result = cache.load_manifest(self.__cache_dir)
+
+        # Assert
+        self.assertEqual(result, {})
+
+
+class TestPruneCache(unittest.TestCase):
+    """
+    Test cases for the prune_cache function.
+    """
+    def setUp(self):
+        self.__temporary_dir = tempfile.TemporaryDirectory()
+        self.__cache_dir = os.path.join(self.__temporary_dir.name, 'cache')
+
+    def tearDown(self):
+        self.__temporary_dir.cleanup()
+
+    def test_01_unused_entries_removed(self):
+        """
+        Verify that prune_cache drops the entries of missing source files and the unused models
+        """
+        # Arrange
+        source_file = os.path.join(self.__temporary_dir.name, 'foo.py')
+        with open(source_file, 'w', encoding='utf-8') as file:
+            file.write('class Foo:\n    pass\n')
+        missing_file = os.path.join(self.__temporary_dir.name, 'missing.py')
+        manifest = {source_file: (1, 2, 'used'), missing_file: (1, 2, 'missing')}
+        for key in ('used', 'missing', 'stale'):
+            cache.store_models(self.__cache_dir, key, [])
+
+        # Act
+        result = cache.prune_cache(self.__cache_dir, manifest)
+
+        # Assert
+        self.assertEqual(result, {source_file: (1, 2, 'used')})
+        self.assertEqual(os.listdir(self.__cache_dir), ['used' + cache.CACHE_FILE_EXTENSION])
+
+    def test_02_missing_cache_dir(self):
+        """
+        Verify that prune_cache does not fail when the cache directory does not exist
+        """
+        # Act
+        result = cache.prune_cache(self.__cache_dir, {})
+
+        # Assert
+        self.assertEqual(result, {})
@@ -3,163 +3,129 @@ Module containing the tests for the python_to_model module.
 """
 import unittest
 
+from unittest.mock import DEFAULT, MagicMock, call, patch
+
 import src.converters.python_to_model as p2m
 
-from src.models import Variable, Visibility
+from src.models import Method, Variable, Visibility
 
 
 class TestSplitClasses(unittest.TestCase):
     """
     Test cases for the split_classes function.
     """
-    def test_01_single_class_no_additional_content(self):
+    def test_01_valid_files(self):
         """
-        Verify that split_classes returns a list containing a single element
-            when the file contains a single class
+        Verify that split_classes returns the lines of each class of a valid file, without the
+            content around the classes
         """
-        # Arrange
-        file_contents = [
-            'class TestClass:',
-            '    pass'
+        single_class = ['class TestClass:', '    pass']
+        second_class = ['class TestClass2:', '    pass']
+        imports = ['import unittest', '']
+        main = ['', 'if __name__ == "__main__":', '    unittest.main()']
+        methods_class = ['class TestClass:', '    def foo(self):', '        pass', '',
+                         '    def bar(self):', '        pass']
+        functions = ['import unittest', '', 'def test_01():', '    pass', '',
+                     'def test_02():', '    pass']
+        cases = [
+            ('single class', single_class, [single_class]),
+            ('content before', imports + single_class, [single_class]),
+            ('content after', single_class + main, [single_class]),
+            ('content before and after', imports + single_class + main, [single_class]),
+            ('two classes', single_class + [''] + second_class, [single_class, second_class]),
+            ('content between', single_class + [''] + imports + second_class,
+             [single_class, second_class]),
+            ('no classes', functions, []),
+            ('blank lines inside class', methods_class + ['', 'x = TestClass()'], [methods_class])
         ]
 
-        # Act
-        result = p2m.split_classes(file_contents)
+        for description, file_contents, expected_classes in cases:
+            with self.subTest(description):
+                # Act
+                result = p2m.split_classes(file_contents)
 
-        # Assert
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0], file_contents)
+                # Assert
+                self.assertEqual(result, expected_classes)
 
-    def test_02_single_class_additional_content_before(self):
+    def test_02_lines_iterator(self):
         """
-        Verify that split_classes returns a list containing a single element
-            when the file contains a single class with additional content before
+        Verify that split_classes accepts the lines as an iterator, e.g. an open file
         """
         # Arrange
-        file_contents = [
-            'import unittest',
-            '',
-            'class TestClass:',
-            '    pass'
-        ]
+        file_contents = ['class TestClass:', '    pass', 'class TestClass2:', '    pass']
 
         # Act
-        result = p2m.split_classes(file_contents)
+        result = p2m.split_classes(iter(file_contents))
 
         # Assert
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0], file_contents[2:])
+        self.assertEqual(result, [file_contents[:2], file_contents[2:]])
 
-    def test_03_single_class_additional_content_after(self):
+    def test_03_invalid_files(self):
         """
-        Verify that split_classes returns a list containing a single element
-            when the file contains a single class with additional content after
+        Verify that split_classes splits the lines of a file which is not valid Python, keeping
+            each class whole across the blank lines inside it
         """
-        # Arrange
-        file_contents = [
-            'class TestClass:',
-            '    pass',
-            '',
-            'if __name__ == "__main__":',
-            '    unittest.main()'
+        invalid_class = ['class TestClass:', '    def foo(self:']
+        second_class = ['class TestClass2:', '    pass']
+        blank_lines_class = invalid_class + ['', '    def bar(self):', '        pass']
+        cases = [
+            ('two classes', invalid_class + second_class, [invalid_class, second_class]),
+            ('blank lines inside class', blank_lines_class + ['x = TestClass()'],
+             [blank_lines_class])
         ]
 
-        # Act
-        result = p2m.split_classes(file_contents)
-
-        # Assert
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0], file_contents[:2])
-
-    def test_04_single_class_additional_content_before_and_after(self):
-        """
-        Verify that split_classes returns a list containing a single element
-            when the file contains a single class with additional content before and after
-        """
-        # Arrange
-        file_contents = [
-            'import unittest',
-            '',
-            'class TestClass:',
-            '    pass',
-            '',
-            'if __name__ == "__main__":',
-            '    unittest.main()'
-        ]
+        for description, file_contents, expected_classes in cases:
+            with self.subTest(description):
+                # Act
+                result = p2m.split_classes(file_contents)
 
-        # Act
-        result = p2m.split_classes(file_contents)
+                # Assert
+                self.assertEqual(result, expected_classes)
 
-        # Assert
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0], file_contents[2:4])
 
-    def test_05_two_classes_no_additional_content(self):
+class TestIterClassesText(unittest.TestCase):
+    """
+    Test cases for the iter_classes_text function.
+    """
+    def test_01_same_as_lines(self):
         """
-        Verify that split_classes returns a list containing two elements
-            when the file contains two classes
+        Verify that iter_classes_text splits the text like split_classes splits its lines
         """
         # Arrange
-        file_contents = [
-            'class TestClass:',
-            '    pass',
-            '',
-            'class TestClass2:',
-            '    pass'
-        ]
+        source = 'import os\nclass Foo:\n    pass\nx = 5\nclass Bar(Foo):\n\tpass\n'
 
         # Act
-        result = p2m.split_classes(file_contents)
+        result = list(p2m.iter_classes_text(source))
 
         # Assert
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0], file_contents[:2])
-        self.assertEqual(result[1], file_contents[3:])
+        self.assertEqual(result, p2m.split_classes(source.splitlines()))
+        self.assertEqual(result, [['class Foo:', '    pass'], ['class Bar(Foo):', '\tpass']])
 
-    def test_06_two_classes_additional_content_middle(self):
+    def test_02_no_classes(self):
         """
-        Verify that split_classes returns a list containing two elements
-            when the file contains two classes with additional content in the middle
+        Verify that iter_classes_text yields nothing when the text contains no class definitions
         """
         # Arrange
-        file_contents = [
-            'class TestClass:',
-            '    pass',
-            '',
-            'import unittest',
-            '',
-            'class TestClass2:',
-            '    pass'
-        ]
+        source = 'classes = []\n\ndef foo():\n    class_ = 5\n'
 
         # Act
-        result = p2m.split_classes(file_contents)
+        result = list(p2m.iter_classes_text(source))
 
         # Assert
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0], file_contents[:2])
-        self.assertEqual(result[1], file_contents[5:])
+        self.assertEqual(result, [])
 
-    def test_07_no_classes(self):
+    def test_03_blank_lines(self):
         """
-        Verify that split_classes returns an empty list when the file contains no classes
+        Verify that iter_classes_text keeps a class whole across the blank lines inside it
         """
         # Arrange
-        file_contents = [
-            'import unittest',
-            '',
-            'def test_01():',
-            '    pass',
-            '',
-            'def test_02():',
-            '    pass'
-        ]
+        source = 'class Foo:\n    x = 5\n\n  \n    y = 6\nz = Foo()\n'
 
         # Act
-        result = p2m.split_classes(file_contents)
+        result = list(p2m.iter_classes_text(source))
 
         # Assert
-        self.assertEqual(len(result), 0)
+        self.assertEqual(result, [['class Foo:', '    x = 5', '', '  ', '    y = 6']])
 
 
 class TestGetClassName(unittest.TestCase):
@@ -218,17 +184,48 @@ class TestGetClassName(unittest.TestCase):
         with self.assertRaises(ValueError):
             p2m.get_class_name(class_content)
 
+    def test_05_has_class_name_with_comment(self):
+        """
+        Verify that get_class_name returns the class name when the first line ends in a comment
+        """
+        # Arrange
+        class_content = 'class  TestClass (Base):  # A comment'
+
+        # Act
+        result = p2m.get_class_name(class_content)
+
+        # Assert
+        self.assertEqual(result, 'TestClass')
+
+    def test_06_has_class_name_multi_line_definition(self):
+        """
+        Verify that get_class_name returns the class name when the first line leaves the parents
+            open for the next lines
+        """
+        # Arrange
+        class_content = 'class TestClass(Base,'
+
+        # Act
+        result = p2m.get_class_name(class_content)
+
+        # Assert
+        self.assertEqual(result, 'TestClass')
+
 
 class TestGetClassAttributes(unittest.TestCase):
     """
     Test cases for the get_class_attributes function
     """
+    @classmethod
+    def setUpClass(cls):
+        cls.class_header = ['class TestClass():', '\tdef __init__(self):']
+
     def test_01_zero_class_attirbutes(self):
         """
         Verify that get_class_attributes returns an empty list when there are no attributes
         """
         # Arrange
-        content = ['class TestClass():', '\tdef __init__(self):', '\t\tprint("Hello world")']
+        content = self.class_header + ['\t\tprint("Hello world")']
 
         # Act
         result = p2m.get_class_attributes(content)
@@ -243,7 +240,7 @@ class TestGetClassAttributes(unittest.TestCase):
         # Arrange
         variable_name = 'x'
 
-        content = ['class TestClass():', '\tdef __init__(self):', f'\t\tself.{variable_name} = 5']
+        content = self.class_header + [f'\t\tself.{variable_name} = 5']
         expected_variable = Variable(variable_name, Visibility.PUBLIC, '')
 
         # Act
@@ -252,172 +249,1444 @@ class TestGetClassAttributes(unittest.TestCase):
         # Assert
         self.assertEqual(result, [expected_variable])
 
-
-class TestGetClassType(unittest.TestCase):
-    """
-    Test cases for the get_class_type function
-    """
-    def test_01_no_parent_class(self):
+    def test_03_invalid_class(self):
+        """
+        Verify that get_class_attributes scans the lines of a class which is not valid Python
+        """
         # Arrange
-        content = 'class Foo:'
-        expected_class_type = p2m.ClassType.CLASS
+        content = self.class_header + ['\t\tself._x: int = (']
+        expected_variable = Variable('x', Visibility.PROTECTED, 'int')
 
         # Act
-        actual_class_type = p2m.get_class_type(content)
+        result = p2m.get_class_attributes(content)
 
         # Assert
-        self.assertEqual(actual_class_type, expected_class_type)
+        self.assertEqual(result, [expected_variable])
 
-    def test_02_parent_normal_class(self):
+    def test_04_invalid_class_same_line_statement(self):
+        """
+        Verify that get_class_attributes finds an attribute assigned after a colon on the same line
+            in a class which is not valid Python
+        """
         # Arrange
-        content = 'class Foo(Bar):'
-        expected_class_type = p2m.ClassType.CLASS
+        content = ['class TestClass(:', '    def __init__(self, x):', '        if x: self.x = x']
+        expected_variable = Variable('x', Visibility.PUBLIC, '')
 
         # Act
-        actual_class_type = p2m.get_class_type(content)
+        result = p2m.get_class_attributes(content)
 
         # Assert
-        self.assertEqual(actual_class_type, expected_class_type)
+        self.assertEqual(result, [expected_variable])
 
-    def test_03_parent_abstract(self):
+    def test_05_invalid_class_assignment_in_string(self):
+        """
+        Verify that get_class_attributes skips assignments inside strings and comparisons
+            in a class which is not valid Python
+        """
         # Arrange
-        content = 'class Foo(ABC):'
-        expected_class_type = p2m.ClassType.ABSTRACT
+        content = [
+            'class TestClass(:',
+            '    def __init__(self):',
+            '        """',
+            '        self.x = 5',
+            '        """',
+            '        self.y == 5',
+            '        self.z = 5',
+            '        self.z = 6'
+        ]
+        expected_variable = Variable('z', Visibility.PUBLIC, '')
 
         # Act
-        actual_class_type = p2m.get_class_type(content)
+        result = p2m.get_class_attributes(content)
 
         # Assert
-        self.assertEqual(actual_class_type, expected_class_type)
+        self.assertEqual(result, [expected_variable])
 
-    def test_04_parent_enum(self):
+    def test_06_result_not_shared(self):
+        """
+        Verify that changing the result of get_class_attributes does not affect later calls
+            for the same class
+        """
         # Arrange
-        content = 'class Foo(Enum):'
-        expected_class_type = p2m.ClassType.ENUM
+        content = self.class_header + ['\t\tself.x = 5']
+        p2m.get_class_attributes(content).clear()
 
         # Act
-        actual_class_type = p2m.get_class_type(content)
+        result = p2m.get_class_attributes(content)
 
         # Assert
-        self.assertEqual(actual_class_type, expected_class_type)
+        self.assertEqual(result, [Variable('x', Visibility.PUBLIC, '')])
 
-    def test_05_parent_exception(self):
+    def test_07_source_string(self):
+        """
+        Verify that get_class_attributes accepts the class as a single string
+        """
         # Arrange
-        content = 'class Foo(Exception):'
-        expected_class_type = p2m.ClassType.EXCEPTION
+        source = '\n'.join(self.class_header + ['\t\tself.x = 5'])
 
         # Act
-        actual_class_type = p2m.get_class_type(content)
+        result = p2m.get_class_attributes(source)
 
         # Assert
-        self.assertEqual(actual_class_type, expected_class_type)
+        self.assertEqual(result, [Variable('x', Visibility.PUBLIC, '')])
 
-    def test_06_no_parent_but_with_parenthesis(self):
+    def test_08_same_name_different_underscores(self):
+        """
+        Verify that get_class_attributes keeps attributes whose names differ only in their
+            leading underscores, stripping at most two of them
+        """
         # Arrange
-        content = 'class Foo():'
-        expected_class_type = p2m.ClassType.CLASS
+        lines = ['\t\tself._x = 5', '\t\tself.x = 6', '\t\tself.___y = 7']
+        valid_content = self.class_header + lines
+        invalid_content = valid_content + ['\tdef foo(self:']
+        expected_variables = [
+            Variable('x', Visibility.PROTECTED, ''),
+            Variable('x', Visibility.PUBLIC, ''),
+            Variable('_y', Visibility.PRIVATE, '')
+        ]
 
-        # Act
-        actual_class_type = p2m.get_class_type(content)
+        for content in (valid_content, invalid_content):
+            with self.subTest(content=content):
+                # Act
+                result = p2m.get_class_attributes(content)
 
-        # Assert
-        self.assertEqual(actual_class_type, expected_class_type)
+                # Assert
+                self.assertEqual(result, expected_variables)
 
-    def test_07_parent_abstract_full_import(self):
+    def test_09_invalid_class_comparison(self):
+        """
+        Verify that get_class_attributes does not take a comparison in a condition for an
+            assignment in a class which is not valid Python
+        """
         # Arrange
-        content = 'class Foo(abc.ABC):'
-        expected_class_type = p2m.ClassType.ABSTRACT
+        content = ['class TestClass(:', '    def foo(self):', '        if self.x == 5:',
+                   '            pass']
 
         # Act
-        actual_class_type = p2m.get_class_type(content)
+        result = p2m.get_class_attributes(content)
 
         # Assert
-        self.assertEqual(actual_class_type, expected_class_type)
+        self.assertEqual(result, [])
 
-    def test_08_parent_enum_full_import(self):
+    def test_10_invalid_class_long_line(self):
+        """
+        Verify that get_class_attributes scans a long line of repeated annotations without
+            backtracking, in a class which is not valid Python
+        """
         # Arrange
-        content = 'class Foo(enum.Enum):'
-        expected_class_type = p2m.ClassType.ENUM
+        content = self.class_header + ['\t\t' + 'self.x:' * 5000]
 
         # Act
-        actual_class_type = p2m.get_class_type(content)
+        result = p2m.get_class_attributes(content)
 
         # Assert
-        self.assertEqual(actual_class_type, expected_class_type)
+        self.assertEqual(result, [Variable('x', Visibility.PUBLIC, '')])
+
+
+class TestGetClassType(unittest.TestCase):
+    """
+    Test cases for the get_class_type function
+    """
+    def test_01_plain_classes(self):
+        """
+        Verify that get_class_type returns CLASS when no parent makes the class special
+        """
+        cases = [
+            ('class Foo:', p2m.ClassType.CLASS),
+            ('class Foo(Bar):', p2m.ClassType.CLASS),
+            ('class Foo():', p2m.ClassType.CLASS),
+            ('class Foo(EnumMixin):', p2m.ClassType.CLASS)
+        ]
+
+        for content, expected_class_type in cases:
+            with self.subTest(content=content):
+                # Act
+                actual_class_type = p2m.get_class_type(content)
+
+                # Assert
+                self.assertEqual(actual_class_type, expected_class_type)
+
+    def test_02_abstract_classes(self):
+        """
+        Verify that get_class_type returns ABSTRACT for the ABC parent or the ABCMeta metaclass
+        """
+        cases = [
+            ('class Foo(ABC):', p2m.ClassType.ABSTRACT),
+            ('class Foo(abc.ABC):', p2m.ClassType.ABSTRACT),
+            ('class Foo(Bar, metaclass=abc.ABCMeta):', p2m.ClassType.ABSTRACT)
+        ]
+
+        for content, expected_class_type in cases:
+            with self.subTest(content=content):
+                # Act
+                actual_class_type = p2m.get_class_type(content)
+
+                # Assert
+                self.assertEqual(actual_class_type, expected_class_type)
+
+    def test_03_enums(self):
+        """
+        Verify that get_class_type returns ENUM for the enum parents of the standard library
+        """
+        cases = [
+            ('class Foo(Enum):', p2m.ClassType.ENUM),
+            ('class Foo(enum.Enum):', p2m.ClassType.ENUM),
+            ('class Foo(IntEnum):', p2m.ClassType.ENUM),
+            ('class Foo(str, enum.StrEnum):', p2m.ClassType.ENUM),
+            ('class Foo(Flag):', p2m.ClassType.ENUM),
+            ('class Foo(enum.IntFlag):', p2m.ClassType.ENUM)
+        ]
+
+        for content, expected_class_type in cases:
+            with self.subTest(content=content):
+                # Act
+                actual_class_type = p2m.get_class_type(content)
+
+                # Assert
+                self.assertEqual(actual_class_type, expected_class_type)
+
+    def test_04_exceptions(self):
+        """
+        Verify that get_class_type returns EXCEPTION for the exception parents
+        """
+        cases = [
+            ('class Foo(Exception):', p2m.ClassType.EXCEPTION),
+            ('class Foo(BaseException):', p2m.ClassType.EXCEPTION),
+            ('class Foo(Exception):  # (Enum)', p2m.ClassType.EXCEPTION)
+        ]
+
+        for content, expected_class_type in cases:
+            with self.subTest(content=content):
+                # Act
+                actual_class_type = p2m.get_class_type(content)
+
+                # Assert
+                self.assertEqual(actual_class_type, expected_class_type)
 
 
 class TestGetMethods(unittest.TestCase):
     """
     Test cases for the get_methods function
     """
-    pass
+    def test_01_no_methods(self):
+        """
+        Verify that get_methods returns an empty list when the class has no methods
+        """
+        # Arrange
+        content = ['class Foo:', '    pass']
+
+        # Act
+        result = p2m.get_methods(content)
+
+        # Assert
+        self.assertEqual(result, [])
+
+    def test_02_one_method(self):
+        """
+        Verify that get_methods returns the method of the class
+        """
+        # Arrange
+        content = ['class Foo:', '    def _foo(self) -> str:', '        return ""']
+        expected_method = Method('_foo', Visibility.PROTECTED, None, 'str')
+
+        # Act
+        result = p2m.get_methods(content)
+
+        # Assert
+        self.assertEqual(result, [expected_method])
+
+    def test_03_decorated_methods_skipped(self):
+        """
+        Verify that get_methods skips the static and the abstract methods
+        """
+        # Arrange
+        content = [
+            'class Foo(ABC):',
+            '    def foo(self):',
+            '        pass',
+            '    @staticmethod',
+            '    def bar():',
+            '        pass',
+            '    @abstractmethod',
+            '    def baz(self):',
+            '        pass'
+        ]
+
+        # Act
+        result = p2m.get_methods(content)
+
+        # Assert
+        self.assertEqual([method.name for method in result], ['foo'])
+
+    def test_04_invalid_class(self):
+        """
+        Verify that get_methods scans the lines of a class which is not valid Python
+        """
+        # Arrange
+        content = ['class Foo:', '    def foo(self, a: int):', '        return (']
+        expected_method = Method('foo', Visibility.PUBLIC,
+                                 [Variable('a', Visibility.PUBLIC, 'int')], None)
+
+        # Act
+        result = p2m.get_methods(content)
+
+        # Assert
+        self.assertEqual(result, [expected_method])
+
+    @patch('src.converters.python_to_model.parse_class_ast')
+    def test_05_no_methods_not_parsed(self, mocked_parse_class_ast):
+        """
+        Verify that get_methods does not parse a class without any method definition
+        """
+        # Arrange
+        content = ['class Foo(Enum):', '    A = 0', '    B = 1']
+
+        # Act
+        result = p2m.get_methods(content)
+
+        # Assert
+        self.assertEqual(result, [])
+        mocked_parse_class_ast.assert_not_called()
+
+    def test_06_invalid_class_method(self):
+        """
+        Verify that get_methods keeps a class method of a class which is not valid Python,
+            without its `cls` argument
+        """
+        # Arrange
+        content = ['class Foo:', '    @classmethod  # Alternative constructor',
+                   '    def create(cls, a: int) -> "Foo":', '        return (']
+        expected_method = Method('create', Visibility.PUBLIC,
+                                 [Variable('a', Visibility.PUBLIC, 'int')], "'Foo'")
+
+        # Act
+        result = p2m.get_methods(content)
+
+        # Assert
+        self.assertEqual(result, [expected_method])
 
 
 class TestParseMethods(unittest.TestCase):
     """
     Test cases for the parse_methods function
     """
-    pass
+    def test_01_complete_definition(self):
+        """
+        Verify that parse_method parses every part of a complete method definition
+        """
+        # Arrange
+        raw_method = '    def __foo(self, a: dict[str, int], *args) -> Optional[str]:'
+        expected_method = Method('__foo', Visibility.PRIVATE,
+                                 [Variable('a', Visibility.PUBLIC, 'dict[str, int]'),
+                                  Variable('*args', Visibility.PUBLIC, '')], 'Optional[str]')
+
+        # Act
+        result = p2m.parse_method(raw_method)
 
+        # Assert
+        self.assertEqual(result, expected_method)
 
-class TestParseArguments(unittest.TestCase):
-    """
-    Test cases for the parse_arguments function
-    """
-    pass
+    def test_02_incomplete_definition(self):
+        """
+        Verify that parse_method splits the first line of a multi-line method definition
+        """
+        # Arrange
+        raw_method = 'def foo(self, a: int,'
 
+        # Act
+        result = p2m.parse_method(raw_method)
 
-class TestParseReturnType(unittest.TestCase):
-    """
-    Test cases for the parse_return_type function
-    """
-    pass
+        # Assert
+        self.assertEqual(result.name, 'foo')
+        self.assertEqual(result.visibility, Visibility.PUBLIC)
+        self.assertIsNone(result.return_type)
 
+    @patch('src.converters.python_to_model.parse_method')
+    def test_03_complete_definitions_parsed_together(self, mocked_parse_method):
+        """
+        Verify that parse_methods parses complete method definitions without parse_method
+        """
+        # Arrange
+        raw_methods = ['    def foo(self) -> int:', '    def bar(a: str):']
 
-class TestGetStaticMethods(unittest.TestCase):
-    """
-    Test cases for the get_static_methods function
-    """
-    pass
+        # Act
+        result = p2m.parse_methods(raw_methods)
 
+        # Assert
+        mocked_parse_method.assert_not_called()
+        self.assertEqual(result, [Method('foo', Visibility.PUBLIC, None, 'int'),
+                                  Method('bar', Visibility.PUBLIC,
+                                         [Variable('a', Visibility.PUBLIC, 'str')], None)])
 
-class TestGetAbstractMethods(unittest.TestCase):
-    """
-    Test cases for the get_abstract_methods function
-    """
-    pass
+    def test_04_incomplete_definition(self):
+        """
+        Verify that parse_methods parses each method on its own when a definition is incomplete
+        """
+        # Arrange
+        raw_methods = ['    def foo(self) -> int:', '    def bar(self, a: str,']
 
+        # Act
+        result = p2m.parse_methods(raw_methods)
 
-class TestParseVisibilityMethods(unittest.TestCase):
-    """
-    Test cases for the parse_visibility function
-    """
-    pass
+        # Assert
+        self.assertEqual([method.name for method in result], ['foo', 'bar'])
+        self.assertEqual(result[0].return_type, 'int')
 
 
-class TestExtractItemMethods(unittest.TestCase):
+class TestParseArguments(unittest.TestCase):
     """
-    Test cases for the extract_item function
+    Test cases for the parse_arguments function
     """
-    pass
+    @classmethod
+    def setUpClass(cls):
+        cls.untyped_argument = Variable('a', Visibility.PUBLIC, '')
+
+    def test_01_no_arguments(self):
+        """
+        Verify that parse_arguments returns an empty list when the method has only self
+        """
+        # Act
+        result = p2m.parse_arguments('def foo(self):')
 
+        # Assert
+        self.assertEqual(result, [])
 
-class TestParseAttributeMethods(unittest.TestCase):
-    """
-    Test cases for the parse_attribute function
-    """
-    pass
+    def test_02_one_argument_without_type(self):
+        """
+        Verify that parse_arguments skips self and returns an argument without a type
+        """
+        # Arrange
+        expected_arguments = [self.untyped_argument]
 
+        # Act
+        result = p2m.parse_arguments('    def foo(self, a):')
 
-class TestGenerateModelsMethods(unittest.TestCase):
-    """
-    Test cases for the generate_models function
-    """
-    pass
+        # Assert
+        self.assertEqual(result, expected_arguments)
 
+    def test_03_two_arguments_with_type(self):
+        """
+        Verify that parse_arguments reads the types and ignores the default values
+        """
+        # Arrange
+        expected_arguments = [Variable('a', Visibility.PUBLIC, 'int'),
+                              Variable('_b', Visibility.PROTECTED, 'str')]
 
-class TestGenerateModelMethods(unittest.TestCase):
-    """
-    Test cases for the generate_model function
-    """
-    pass
\ No newline at end of file
+        # Act
+        result = p2m.parse_arguments('def foo(self, a: int, _b: str = "x") -> None:')
+
+        # Assert
+        self.assertEqual(result, expected_arguments)
+
+    def test_04_argument_with_nested_type(self):
+        """
+        Verify that parse_arguments keeps the commas inside a type
+        """
+        # Arrange
+        expected_arguments = [Variable('a', Visibility.PUBLIC, 'dict[str, int]'),
+                              Variable('b', Visibility.PUBLIC, 'tuple[int, str]')]
+
+        # Act
+        result = p2m.parse_arguments("def foo(a: dict[str, int], b: tuple[int, str] = (2, 'a')):")
+
+        # Assert
+        self.assertEqual(result, expected_arguments)
+
+    def test_05_keyword_only_separator(self):
+        """
+        Verify that parse_arguments skips the bare keyword-only separator
+        """
+        # Arrange
+        expected_arguments = [self.untyped_argument, Variable('**kwargs', Visibility.PUBLIC, '')]
+
+        # Act
+        result = p2m.parse_arguments('def foo(cls, *, a, **kwargs):')
+
+        # Assert
+        self.assertEqual(result, expected_arguments)
+
+    def test_06_incomplete_definition(self):
+        """
+        Verify that parse_arguments reads the names, types and defaults of the arguments
+            of an incomplete method definition
+        """
+        # Arrange
+        expected_arguments = [Variable('_a', Visibility.PROTECTED, ''),
+                              Variable('b', Visibility.PUBLIC, 'int'),
+                              Variable('*args', Visibility.PUBLIC, 'str')]
+
+        # Act
+        result = p2m.parse_arguments('def foo(self, _a, b: int = 5, *args: str) -> Optional[')
+
+        # Assert
+        self.assertEqual(result, expected_arguments)
+
+    def test_07_long_unclosed_brackets(self):
+        """
+        Verify that parse_arguments returns no arguments for a long line of unclosed brackets
+            without backtracking over it
+        """
+        # Act
+        result = p2m.parse_arguments('def foo' + '(' * 40000)
+
+        # Assert
+        self.assertEqual(result, [])
+
+
+class TestSplitArguments(unittest.TestCase):
+    """
+    Test cases for the split_arguments function
+    """
+    def test_01_no_arguments(self):
+        """
+        Verify that split_arguments returns an empty list for empty parentheses
+        """
+        # Act
+        result = p2m.split_arguments('')
+
+        # Assert
+        self.assertEqual(result, [])
+
+    def test_02_flat_arguments(self):
+        """
+        Verify that split_arguments splits on every comma when there are no brackets
+        """
+        # Act
+        result = p2m.split_arguments('self, a: int,  b')
+
+        # Assert
+        self.assertEqual(result, ['self', 'a: int', 'b'])
+
+    def test_03_nested_arguments(self):
+        """
+        Verify that split_arguments does not split on commas inside brackets
+        """
+        # Act
+        result = p2m.split_arguments('a: list[tuple[int, str]], b=f(1, 2), c={1: 2, 3: 4}')
+
+        # Assert
+        self.assertEqual(result, ['a: list[tuple[int, str]]', 'b=f(1, 2)', 'c={1: 2, 3: 4}'])
+
+
+class TestParseArgument(unittest.TestCase):
+    """
+    Test cases for the parse_argument function
+    """
+    def test_01_argument_without_type(self):
+        """
+        Verify that parse_argument returns an argument without a type
+        """
+        # Act
+        result = p2m.parse_argument('a')
+
+        # Assert
+        self.assertEqual(result, Variable('a', Visibility.PUBLIC, ''))
+
+    def test_02_argument_with_type_and_default(self):
+        """
+        Verify that parse_argument returns the type without the default value
+        """
+        # Act
+        result = p2m.parse_argument('__a: list[int] = []')
+
+        # Assert
+        self.assertEqual(result, Variable('__a', Visibility.PRIVATE, 'list[int]'))
+
+    def test_03_invalid_argument(self):
+        """
+        Verify that parse_argument throws an exception when there is no argument name
+        """
+        # Act & assert
+        with self.assertRaises(ValueError):
+            p2m.parse_argument(': int')
+
+
+class TestParseReturnType(unittest.TestCase):
+    """
+    Test cases for the parse_return_type function
+    """
+    def test_01_has_return_type(self):
+        """
+        Verify that parse_return_type returns the annotated return type of a method
+        """
+        # Arrange
+        raw_method = '    def foo(self, x: int) -> dict[str, int]:'
+
+        # Act
+        result = p2m.parse_return_type(raw_method)
+
+        # Assert
+        self.assertEqual(result, 'dict[str, int]')
+
+    def test_02_no_return_type(self):
+        """
+        Verify that parse_return_type returns an empty string when the method is not annotated
+        """
+        # Arrange
+        raw_method = '    def foo(self, x: int):'
+
+        # Act
+        result = p2m.parse_return_type(raw_method)
+
+        # Assert
+        self.assertEqual(result, '')
+
+
+class TestGetStaticMethods(unittest.TestCase):
+    """
+    Test cases for the get_static_methods function
+    """
+    def test_01_no_static_methods(self):
+        """
+        Verify that get_static_methods returns an empty list when there are no such methods
+        """
+        # Arrange
+        content = ['class Foo:', '    def foo(self):', '        pass']
+
+        # Act
+        result = p2m.get_static_methods(content)
+
+        # Assert
+        self.assertEqual(result, [])
+
+    def test_02_one_static_method(self):
+        """
+        Verify that get_static_methods returns the method following the decorator
+        """
+        # Arrange
+        content = ['class Foo:', '    @staticmethod', '    def foo():', '        pass']
+        expected_method = Method('foo', Visibility.PUBLIC, None, None)
+
+        # Act
+        result = p2m.get_static_methods(content)
+
+        # Assert
+        self.assertEqual(result, [expected_method])
+
+    def test_03_other_decorators(self):
+        """
+        Verify that get_static_methods skips the methods with other decorators
+        """
+        # Arrange
+        content = [
+            'class Foo:',
+            '    @abstractmethod',
+            '    def foo(self):',
+            '        pass',
+            '    @staticmethod',
+            '    @other_decorator',
+            '    def bar() -> int:',
+            '        pass'
+        ]
+        expected_method = Method('bar', Visibility.PUBLIC, None, 'int')
+
+        # Act
+        result = p2m.get_static_methods(content)
+
+        # Assert
+        self.assertEqual(result, [expected_method])
+
+    def test_04_class_parsed_once(self):
+        """
+        Verify that get_methods and get_static_methods share a single parse of the class
+        """
+        # Arrange
+        content = ['class Foo:', '    @staticmethod', '    def foo():', '        pass',
+                   '    def bar(self):', '        pass']
+        p2m.get_methods_by_type.cache_clear()
+
+        # Act
+        with patch('src.converters.python_to_model.parse_class_ast',
+                   wraps=p2m.parse_class_ast) as mocked_parse_class_ast:
+            methods = p2m.get_methods(content)
+            static_methods = p2m.get_static_methods(content)
+
+        # Assert
+        mocked_parse_class_ast.assert_called_once()
+        self.assertEqual([method.name for method in methods], ['bar'])
+        self.assertEqual([method.name for method in static_methods], ['foo'])
+
+    def test_05_static_abstract_method(self):
+        """
+        Verify that get_static_methods keeps a static method also decorated as abstract,
+            whether the class is valid Python or not
+        """
+        # Arrange
+        valid_content = ['class Foo(ABC):', '    @staticmethod', '    @abstractmethod',
+                         '    def foo():', '        pass']
+        invalid_content = valid_content + ['    def bar(self:']
+
+        for content in (valid_content, invalid_content):
+            with self.subTest(content=content):
+                # Act
+                static_methods = p2m.get_static_methods(content)
+                abstract_methods = p2m.get_abstract_methods(content)
+
+                # Assert
+                self.assertEqual([method.name for method in static_methods], ['foo'])
+                self.assertEqual(abstract_methods, [])
+
+
+class TestGetAbstractMethods(unittest.TestCase):
+    """
+    Test cases for the get_abstract_methods function
+    """
+    def test_01_no_abstract_methods(self):
+        """
+        Verify that get_abstract_methods returns an empty list when there are no such methods
+        """
+        # Arrange
+        content = ['class Foo:', '    def foo(self):', '        pass']
+
+        # Act
+        result = p2m.get_abstract_methods(content)
+
+        # Assert
+        self.assertEqual(result, [])
+
+    def test_02_one_abstract_method(self):
+        """
+        Verify that get_abstract_methods returns the method following the decorator
+        """
+        # Arrange
+        content = ['class Foo:', '    @abstractmethod', '    def foo(self):', '        pass']
+        expected_method = Method('foo', Visibility.PUBLIC, None, None)
+
+        # Act
+        result = p2m.get_abstract_methods(content)
+
+        # Assert
+        self.assertEqual(result, [expected_method])
+
+    def test_03_other_decorators(self):
+        """
+        Verify that get_abstract_methods skips the methods with other decorators
+        """
+        # Arrange
+        content = [
+            'class Foo:',
+            '    @staticmethod',
+            '    def foo(self):',
+            '        pass',
+            '    @abstractmethod',
+            '    @other_decorator',
+            '    def bar(self) -> int:',
+            '        pass'
+        ]
+        expected_method = Method('bar', Visibility.PUBLIC, None, 'int')
+
+        # Act
+        result = p2m.get_abstract_methods(content)
+
+        # Assert
+        self.assertEqual(result, [expected_method])
+
+    def test_04_source_string(self):
+        """
+        Verify that get_abstract_methods accepts the class as a single string
+        """
+        # Arrange
+        source = 'class Foo(ABC):\n    @abstractmethod\n    def foo(self):\n        pass\n'
+        expected_method = Method('foo', Visibility.PUBLIC, None, None)
+
+        # Act
+        result = p2m.get_abstract_methods(source)
+
+        # Assert
+        self.assertEqual(result, [expected_method])
+        self.assertEqual(result, p2m.get_abstract_methods(source.splitlines()))
+
+    def test_05_abstract_class_method(self):
+        """
+        Verify that get_abstract_methods keeps an abstract method also decorated as a class
+            method, whether the class is valid Python or not
+        """
+        # Arrange
+        valid_content = ['class Foo(ABC):', '    @abstractmethod', '    @classmethod',
+                         '    def foo(cls):', '        pass']
+        invalid_content = valid_content + ['    def bar(self:']
+
+        for content in (valid_content, invalid_content):
+            with self.subTest(content=content):
+                # Act
+                result = p2m.get_abstract_methods(content)
+
+                # Assert
+                self.assertEqual([method.name for method in result], ['foo'])
+
+
+class TestMakeVariableMethods(unittest.TestCase):
+    """
+    Test cases for the make_variable function
+    """
+    def test_01_equal_variables_shared(self):
+        """
+        Verify that make_variable returns the same instance for equal variables
+        """
+        # Act
+        first_variable = p2m.make_variable('x', Visibility.PUBLIC, 'int')
+        second_variable = p2m.make_variable('x', Visibility.PUBLIC, 'int')
+
+        # Assert
+        self.assertIs(first_variable, second_variable)
+
+    def test_02_different_variables(self):
+        """
+        Verify that make_variable returns different instances for different variables
+        """
+        # Act
+        first_variable = p2m.make_variable('x', Visibility.PUBLIC, 'int')
+        second_variable = p2m.make_variable('x', Visibility.PUBLIC, 'str')
+
+        # Assert
+        self.assertEqual(first_variable, Variable('x', Visibility.PUBLIC, 'int'))
+        self.assertEqual(second_variable, Variable('x', Visibility.PUBLIC, 'str'))
+
+
+class TestParseVisibilityMethods(unittest.TestCase):
+    """
+    Test cases for the parse_visibility function
+    """
+    def test_01_attributes(self):
+        """
+        Verify that the visibility of an attribute follows its leading underscores
+        """
+        cases = [
+            ('self.my_attribute =', Visibility.PUBLIC),
+            ('self._my_attribute =', Visibility.PROTECTED),
+            ('self.__my_attribute =', Visibility.PRIVATE)
+        ]
+
+        for raw_attribute, expected_visibility in cases:
+            with self.subTest(raw_attribute=raw_attribute):
+                # Act
+                result = p2m.parse_visibility(raw_attribute)
+
+                # Assert
+                self.assertEqual(result, expected_visibility)
+
+    def test_02_methods(self):
+        """
+        Verify that the visibility of a method follows its leading underscores only
+        """
+        cases = [
+            ('def my_method(self, other_value):', Visibility.PUBLIC),
+            ('    def _my_method(self):', Visibility.PROTECTED),
+            ('def __my_method(self, _other_value):', Visibility.PRIVATE)
+        ]
+
+        for raw_method, expected_visibility in cases:
+            with self.subTest(raw_method=raw_method):
+                # Act
+                result = p2m.parse_visibility(raw_method)
+
+                # Assert
+                self.assertEqual(result, expected_visibility)
+
+    def test_03_bare_names(self):
+        """
+        Verify that the visibility of a bare name follows its leading underscores
+        """
+        cases = [
+            ('value', Visibility.PUBLIC),
+            ('_value', Visibility.PROTECTED),
+            ('__value', Visibility.PRIVATE)
+        ]
+
+        for raw_name, expected_visibility in cases:
+            with self.subTest(raw_name=raw_name):
+                # Act
+                result = p2m.parse_visibility(raw_name)
+
+                # Assert
+                self.assertEqual(result, expected_visibility)
+
+
+class TestParseNameVisibilityMethods(unittest.TestCase):
+    """
+    Test cases for the parse_name_visibility function
+    """
+    def test_01_underscore_counts(self):
+        """
+        Verify that a name is public, protected or private by its leading underscores,
+            with more than two underscores still being private
+        """
+        cases = [
+            ('my_name', Visibility.PUBLIC),
+            ('my__name_', Visibility.PUBLIC),
+            ('_my_name', Visibility.PROTECTED),
+            ('__my_name', Visibility.PRIVATE),
+            ('___my_name', Visibility.PRIVATE)
+        ]
+
+        for name, expected_visibility in cases:
+            with self.subTest(name=name):
+                # Act
+                result = p2m.parse_name_visibility(name)
+
+                # Assert
+                self.assertEqual(result, expected_visibility)
+
+
+class TestParseAttributeMethods(unittest.TestCase):
+    """
+    Test cases for the parse_attribute function
+    """
+    def test_01_public_attribute(self):
+        """
+        Verify that parse_attribute returns a public attribute without a type
+        """
+        # Act
+        result = p2m.parse_attribute('        self.x =')
+
+        # Assert
+        self.assertEqual(result, Variable('x', Visibility.PUBLIC, ''))
+
+    def test_02_not_an_attribute(self):
+        """
+        Verify that parse_attribute throws an exception when the line is not a self assignment
+        """
+        # Act & assert
+        with self.assertRaises(ValueError):
+            p2m.parse_attribute('x = 5')
+
+    def test_03_empty_line(self):
+        """
+        Verify that parse_attribute throws an exception when the line is empty
+        """
+        # Act & assert
+        with self.assertRaises(ValueError):
+            p2m.parse_attribute('')
+
+    def test_04_visibility_parser_called(self):
+        """
+        Verify that parse_attribute parses the visibility from the leading underscores
+        """
+        # Arrange
+        visibility_parser = MagicMock(return_value=Visibility.PRIVATE)
+
+        # Act
+        result = p2m.parse_attribute('self.__x: int = 5', visibility_parser=visibility_parser)
+
+        # Assert
+        visibility_parser.assert_called_once_with('__')
+        self.assertEqual(result, Variable('x', Visibility.PRIVATE, 'int'))
+
+    def test_05_annotated_attribute(self):
+        """
+        Verify that parse_attribute keeps the annotation out of the name of the attribute
+        """
+        # Act
+        result = p2m.parse_attribute('self.x: dict[str, int] = {}')
+
+        # Assert
+        self.assertEqual(result, Variable('x', Visibility.PUBLIC, 'dict[str, int]'))
+
+
+class TestGenerateModelsMethods(unittest.TestCase):
+    """
+    Test cases for the generate_models function
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.file_contents = [
+            'class Foo:',
+            '    pass',
+            'class Bar:',
+            '    pass',
+            'class Baz:',
+            '    pass'
+        ]
+        cls.expected_calls = [call(cls.file_contents[0:2]), call(cls.file_contents[2:4]),
+                              call(cls.file_contents[4:6])]
+
+    def test_01_no_classes(self):
+        """
+        Verify that generate_models yields nothing when the file contains no classes
+        """
+        # Arrange
+        file_contents = ['import unittest', '', 'def foo():', '    pass']
+
+        # Act
+        result = list(p2m.generate_models(file_contents))
+
+        # Assert
+        self.assertEqual(result, [])
+
+    @patch('src.converters.python_to_model.generate_model')
+    def test_02_generate_model_called_per_class(self, mocked_generate_model):
+        """
+        Verify that generate_models calls generate_model once for every class
+        """
+        # Act
+        list(p2m.generate_models(self.file_contents))
+
+        # Assert
+        self.assertEqual(mocked_generate_model.call_count, 3)
+        mocked_generate_model.assert_has_calls(self.expected_calls)
+
+    @patch('src.converters.python_to_model.generate_model')
+    def test_03_generate_models_is_lazy(self, mocked_generate_model):
+        """
+        Verify that generate_models does not generate a model before it is requested
+        """
+        # Act
+        result = p2m.generate_models(self.file_contents)
+        next(result)
+
+        # Assert
+        mocked_generate_model.assert_has_calls(self.expected_calls[:1])
+        self.assertEqual(mocked_generate_model.call_count, 1)
+
+    def test_04_same_split_as_split_classes(self):
+        """
+        Verify that generate_models keeps a valid class whole across a comment at the top level
+        """
+        # Arrange
+        file_contents = ['class A:', '    x = 1', '# note', '    def f(self):', '        pass']
+
+        # Act
+        result = list(p2m.generate_models(file_contents))
+
+        # Assert
+        self.assertEqual(len(result), 1)
+        self.assertEqual([method.name for method in result[0].methods], ['f'])
+
+
+class TestGenerateModelsFromTextMethods(unittest.TestCase):
+    """
+    Test cases for the generate_models_from_text function
+    """
+    @patch('src.converters.python_to_model.iter_classes_text')
+    @patch('src.converters.python_to_model.generate_model')
+    @patch('src.converters.python_to_model.generate_models_ast')
+    def test_01_valid_source(self, mocked_generate_models_ast, mocked_generate_model,
+                             mocked_iter_classes_text):
+        """
+        Verify that generate_models_from_text parses valid source code as a whole
+        """
+        # Arrange
+        source = 'class Foo:\n    pass\n'
+
+        # Act
+        p2m.generate_models_from_text(source)
+
+        # Assert
+        mocked_generate_models_ast.assert_called_once_with(source)
+        mocked_iter_classes_text.assert_not_called()
+        mocked_generate_model.assert_not_called()
+
+    @patch('src.converters.python_to_model.generate_model')
+    def test_02_invalid_source(self, mocked_generate_model):
+        """
+        Verify that generate_models_from_text falls back to the lines of invalid source code
+        """
+        # Arrange
+        source = 'import os\nclass Foo:\n    def foo(self:\n'
+
+        # Act
+        p2m.generate_models_from_text(source)
+
+        # Assert
+        mocked_generate_model.assert_called_once_with(['class Foo:', '    def foo(self:'])
+
+    def test_03_invalid_source_multi_line_definition(self):
+        """
+        Verify that generate_models_from_text keeps a class of invalid source code whose definition
+            spans several lines
+        """
+        # Arrange
+        source = 'class Foo(Bar,\n          Baz):\n    def foo(self:\n'
+
+        # Act
+        result = p2m.generate_models_from_text(source)
+
+        # Assert
+        self.assertEqual([model.name for model in result], ['Foo'])
+
+    def test_04_null_byte(self):
+        """
+        Verify that generate_models_from_text falls back to the lines of source code containing
+            a null byte
+        """
+        # Arrange
+        source = 'class Foo:\n    def foo(self):\n        self.x = "\x00"\n'
+
+        # Act
+        result = p2m.generate_models_from_text(source)
+
+        # Assert
+        self.assertEqual([model.name for model in result], ['Foo'])
+
+    @patch('ast.parse', side_effect=ValueError('source code string cannot contain null bytes'))
+    def test_05_parser_value_error(self, _):
+        """
+        Verify that generate_models_from_text falls back to the lines of source code when the
+            parser raises ValueError, as Python 3.10 does for a null byte
+        """
+        # Arrange
+        source = 'class Foo:\n    def foo(self, x: int):\n        self.x = x\n'
+
+        # Act
+        result = p2m.generate_models_from_text(source)
+
+        # Assert
+        self.assertEqual([model.name for model in result], ['Foo'])
+        self.assertEqual([method.name for method in result[0].methods], ['foo'])
+
+
+class TestGenerateModelMethods(unittest.TestCase):
+    """
+    Test cases for the generate_model function
+    """
+    @patch('src.converters.python_to_model.parse_class')
+    @patch('src.converters.python_to_model.generate_model_ast')
+    def test_01_valid_class(self, mocked_generate_model_ast, mocked_parse_class):
+        """
+        Verify that generate_model parses a valid class as a whole
+        """
+        # Arrange
+        class_content = ['class Foo(Bar):', '    def foo(self):', '        pass']
+
+        # Act
+        p2m.generate_model(class_content)
+
+        # Assert
+        mocked_generate_model_ast.assert_called_once()
+        mocked_parse_class.assert_not_called()
+
+    @patch('src.converters.python_to_model.parse_class')
+    @patch('src.converters.python_to_model.generate_model_ast')
+    def test_02_invalid_class(self, mocked_generate_model_ast, mocked_parse_class):
+        """
+        Verify that generate_model scans the lines of a class which is not valid Python
+        """
+        # Arrange
+        class_content = ['class Foo(Bar):', '    def foo(self:', '        pass']
+
+        # Act
+        p2m.generate_model(class_content)
+
+        # Assert
+        mocked_generate_model_ast.assert_not_called()
+        mocked_parse_class.assert_called_once_with(class_content)
+
+    def test_03_invalid_class_attributes(self):
+        """
+        Verify that generate_model finds the attributes of a class which is not valid Python
+            like get_class_attributes, skipping strings and comparisons and keeping duplicates once
+        """
+        # Arrange
+        class_content = [
+            'class Foo:',
+            '    def foo(self:',
+            '        """self.x = 5"""',
+            '        self.y == 5',
+            '        self.z = 5',
+            '        self.z = 6',
+            '        if a: self.w = 1'
+        ]
+
+        # Act
+        result = p2m.generate_model(class_content)
+
+        # Assert
+        self.assertEqual([attribute.name for attribute in result.attributes], ['z', 'w'])
+        self.assertEqual(result.attributes, p2m.get_class_attributes(class_content))
+
+
+class TestParseClassMethods(unittest.TestCase):
+    """
+    Test cases for the parse_class function
+    """
+    def test_01_class_name_and_type(self):
+        """
+        Verify that parse_class reads the name and the type of the class from the first line
+        """
+        # Arrange
+        class_content = ['class Foo(Enum):', '    A = 0']
+
+        # Act
+        result = p2m.parse_class(class_content)
+
+        # Assert
+        self.assertEqual(result.name, 'Foo')
+        self.assertEqual(result.class_type, p2m.ClassType.ENUM)
+
+    def test_02_no_methods(self):
+        """
+        Verify that parse_class stores None when the class has no methods of any kind
+        """
+        # Arrange
+        class_content = ['class Foo:', '    A = 0']
+
+        # Act
+        result = p2m.parse_class(class_content)
+
+        # Assert
+        self.assertEqual(result.attributes, [])
+        self.assertIsNone(result.methods)
+        self.assertIsNone(result.static_methods)
+        self.assertIsNone(result.abstract_methods)
+
+    def test_03_attributes_and_methods(self):
+        """
+        Verify that parse_class collects the attributes and the methods of every kind
+        """
+        # Arrange
+        class_content = [
+            'class Foo:',
+            '    def __init__(self:',
+            '        self.x = 5',
+            '',
+            '    @staticmethod',
+            '    def bar(a: int):',
+            '        pass',
+            '',
+            '    @abstractmethod',
+            '    def baz(self):',
+            '        pass'
+        ]
+
+        # Act
+        result = p2m.parse_class(class_content)
+
+        # Assert
+        self.assertEqual(result.attributes, [Variable('x', Visibility.PUBLIC, '')])
+        self.assertEqual([method.name for method in result.methods], ['__init__'])
+        self.assertEqual([method.name for method in result.static_methods], ['bar'])
+        self.assertEqual([method.name for method in result.abstract_methods], ['baz'])
+
+
+@patch.multiple('src.converters.python_to_model', get_class_name=DEFAULT, get_class_type=DEFAULT,
+                scan_methods=DEFAULT, parse_grouped_methods=DEFAULT, get_class_attributes=DEFAULT)
+class TestParseClassCollaboratorsMethods(unittest.TestCase):
+    """
+    Test cases for the parse_class function, with its collaborators patched
+    """
+    def setUp(self):
+        self.__class_content = ['class Foo(Bar):', '    def foo(self:', '        self.x = 5']
+        self.__method = Method('foo', Visibility.PUBLIC, None, None)
+        self.__no_methods = {method_type: [] for method_type in p2m.MethodType}
+
+    def test_01_class_name_and_type_from_first_line(self, **mocks):
+        """
+        Verify that parse_class reads the name and the type of the class from the first line
+        """
+        # Arrange
+        mocks['scan_methods'].return_value = self.__no_methods
+        mocks['parse_grouped_methods'].return_value = self.__no_methods
+        mocks['get_class_name'].return_value = 'Foo'
+        mocks['get_class_type'].return_value = p2m.ClassType.ENUM
+
+        # Act
+        result = p2m.parse_class(self.__class_content)
+
+        # Assert
+        mocks['get_class_name'].assert_called_once_with(self.__class_content[0])
+        mocks['get_class_type'].assert_called_once_with(self.__class_content[0])
+        self.assertEqual(result.name, 'Foo')
+        self.assertEqual(result.class_type, p2m.ClassType.ENUM)
+
+    def test_02_attributes_from_get_class_attributes(self, **mocks):
+        """
+        Verify that parse_class takes the attributes from get_class_attributes
+        """
+        # Arrange
+        attributes = [Variable('x', Visibility.PUBLIC, '')]
+        mocks['scan_methods'].return_value = self.__no_methods
+        mocks['parse_grouped_methods'].return_value = self.__no_methods
+        mocks['get_class_attributes'].return_value = attributes
+
+        # Act
+        result = p2m.parse_class(self.__class_content)
+
+        # Assert
+        mocks['get_class_attributes'].assert_called_once_with(self.__class_content)
+        self.assertEqual(result.attributes, attributes)
+
+    def test_03_methods_from_groups(self, **mocks):
+        """
+        Verify that parse_class stores each group of methods, and None for an empty group
+        """
+        # Arrange
+        raw_methods = {
+            p2m.MethodType.METHOD: ['def foo(self):'],
+            p2m.MethodType.STATIC: [],
+            p2m.MethodType.ABSTRACT: ['def bar(self):']
+        }
+        mocks['scan_methods'].return_value = raw_methods
+        mocks['parse_grouped_methods'].return_value = {
+            p2m.MethodType.METHOD: [self.__method],
+            p2m.MethodType.STATIC: [],
+            p2m.MethodType.ABSTRACT: [self.__method]
+        }
+
+        # Act
+        result = p2m.parse_class(self.__class_content)
+
+        # Assert
+        mocks['scan_methods'].assert_called_once_with(self.__class_content)
+        mocks['parse_grouped_methods'].assert_called_once_with(raw_methods)
+        self.assertEqual(result.methods, [self.__method])
+        self.assertIsNone(result.static_methods)
+        self.assertEqual(result.abstract_methods, [self.__method])
+
+
+class TestParseSourceAstMethods(unittest.TestCase):
+    """
+    Test cases for the parse_source_ast function
+    """
+    def test_01_shared_between_getters(self):
+        """
+        Verify that the getters of the attributes and of the methods of a class share its tree
+        """
+        # Arrange
+        content = ['class Foo:', '    def __init__(self):', '        self.x = 5']
+        p2m.parse_source_ast.cache_clear()
+        p2m.parse_class_attributes.cache_clear()
+        p2m.get_methods_by_type.cache_clear()
+
+        # Act
+        p2m.get_class_attributes(content)
+        p2m.get_methods(content)
+
+        # Assert
+        cache_info = p2m.parse_source_ast.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (1, 1))
+
+    def test_02_invalid_source(self):
+        """
+        Verify that parse_source_ast returns None when the source cannot be parsed
+        """
+        # Act
+        result = p2m.parse_source_ast('class Foo(:\n    pass\n')
+
+        # Assert
+        self.assertIsNone(result)
+
+
+class TestGenerateModelsAstMethods(unittest.TestCase):
+    """
+    Test cases for the generate_models_ast function
+    """
+    def test_01_no_classes(self):
+        """
+        Verify that generate_models_ast returns an empty list when the source contains no classes
+        """
+        # Arrange
+        source = 'import unittest\n\ndef foo():\n    pass\n'
+
+        # Act
+        result = p2m.generate_models_ast(source)
+
+        # Assert
+        self.assertEqual(result, [])
+
+    def test_02_class_name_and_type(self):
+        """
+        Verify that generate_models_ast reads the name and the type of every top-level class
+        """
+        # Arrange
+        source = 'class Foo(abc.ABC):\n    pass\n\n\nclass Bar(Enum):\n    A = 0\n'
+
+        # Act
+        result = p2m.generate_models_ast(source)
+
+        # Assert
+        self.assertEqual([model.name for model in result], ['Foo', 'Bar'])
+        self.assertEqual(result[0].class_type, p2m.ClassType.ABSTRACT)
+        self.assertEqual(result[1].class_type, p2m.ClassType.ENUM)
+
+    def test_03_class_attributes(self):
+        """
+        Verify that generate_models_ast collects the attributes assigned through self only once
+        """
+        # Arrange
+        source = '\n'.join([
+            'class Foo:',
+            '    def __init__(self):',
+            '        self.x = 5',
+            '        self._y: int = 6',
+            '',
+            '    def reset(self):',
+            '        self.x = 0',
+            '        z = 1'
+        ])
+        expected_attributes = [Variable('x', Visibility.PUBLIC, ''),
+                               Variable('y', Visibility.PROTECTED, 'int')]
+
+        # Act
+        result = p2m.generate_models_ast(source)
+
+        # Assert
+        self.assertEqual(result[0].attributes, expected_attributes)
+
+    def test_04_methods(self):
+        """
+        Verify that generate_models_ast separates the methods, static methods and abstract methods
+        """
+        # Arrange
+        source = '\n'.join([
+            'class Foo(ABC):',
+            '    def foo(self, a: int, b) -> str:',
+            '        pass',
+            '',
+            '    @staticmethod',
+            '    def bar(a: dict[str, int]):',
+            '        pass',
+            '',
+            '    @abc.abstractmethod',
+            '    def _baz(self):',
+            '        pass'
+        ])
+        expected_methods = [Method('foo', Visibility.PUBLIC,
+                                   [Variable('a', Visibility.PUBLIC, 'int'),
+                                    Variable('b', Visibility.PUBLIC, '')], 'str')]
+        expected_static_methods = [Method('bar', Visibility.PUBLIC,
+                                          [Variable('a', Visibility.PUBLIC, 'dict[str, int]')],
+                                          None)]
+        expected_abstract_methods = [Method('_baz', Visibility.PROTECTED, None, None)]
+
+        # Act
+        result = p2m.generate_models_ast(source)
+
+        # Assert
+        self.assertEqual(result[0].methods, expected_methods)
+        self.assertEqual(result[0].static_methods, expected_static_methods)
+        self.assertEqual(result[0].abstract_methods, expected_abstract_methods)
+
+    def test_05_invalid_source(self):
+        """
+        Verify that generate_models_ast raises SyntaxError when the source cannot be parsed
+        """
+        # Arrange
+        source = 'class Foo(:\n    pass\n'
+
+        # Act & assert
+        with self.assertRaises(SyntaxError):
+            p2m.generate_models_ast(source)
+
+    def test_06_nested_class_attributes(self):
+        """
+        Verify that generate_models_ast skips the attributes assigned in a nested class
+            and unpacks nested tuple targets
+        """
+        # Arrange
+        source = '\n'.join([
+            'class Foo:',
+            '    def __init__(self):',
+            '        self.x, (self.y, z) = 1, (2, 3)',
+            '',
+            '    class Bar:',
+            '        def __init__(self):',
+            '            self.w = 4'
+        ])
+        expected_attributes = [Variable('x', Visibility.PUBLIC, ''),
+                               Variable('y', Visibility.PUBLIC, '')]
+
+        # Act
+        result = p2m.generate_models_ast(source)
+
+        # Assert
+        self.assertEqual(result[0].attributes, expected_attributes)